@@ -1,4 +1,7 @@
 import customtkinter as ctk
+import logging
+import logging.handlers
+import queue
 import sys
 import os
 
@@ -7,7 +10,28 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from ui.main_window import MainWindow
 
+def configure_logging() -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so stream I/O happens on a listener thread.
+    
+    Returns:
+        The started QueueListener (stop it on exit to flush pending records)
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
 def main():
+    listener = configure_logging()
+    
     # Set appearance mode (System, Dark, Light)
     ctk.set_appearance_mode("Dark")
     ctk.set_default_color_theme("blue")
@@ -20,6 +44,8 @@ def main():
     except KeyboardInterrupt:
         print("\nShutting down...")
         app.destroy()
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,6 +1,137 @@
+import math
+from typing import Callable, Optional
 import numpy as np
 import scipy.signal
 
+# Numba availability flag (optional JIT acceleration for the demodulation kernels)
+NUMBA_AVAILABLE = False
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    prange = None
+    print("Warning: numba not installed. Using NumPy FM discriminator.")
+
+
+# FIR decimation switches from polyphase to FFT convolution above these sizes
+FFT_CONV_MIN_TAPS = 256
+FFT_CONV_MIN_SAMPLES = 4096
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _fast_atan2(y: float, x: float) -> float:
+        """
+        Polynomial atan2 approximation (max error ~0.0015 rad).
+        
+        Uses atan(r) ~= pi/4*r - r*(r-1)*(0.2447 + 0.0663*r) on [0, 1] and
+        folds the other octants by symmetry. Plenty for FM audio and much
+        cheaper than libm atan2.
+        """
+        ax = abs(x)
+        ay = abs(y)
+        if ax >= ay:
+            if ax == 0.0:
+                return 0.0
+            r = ay / ax
+            angle = 0.7853981633974483 * r - r * (r - 1.0) * (0.2447 + 0.0663 * r)
+        else:
+            r = ax / ay
+            angle = 1.5707963267948966 - (0.7853981633974483 * r - r * (r - 1.0) * (0.2447 + 0.0663 * r))
+        if x < 0.0:
+            angle = 3.141592653589793 - angle
+        if y < 0.0:
+            angle = -angle
+        return angle
+    
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _fm_discriminate(iq_re: np.ndarray, iq_im: np.ndarray, out: np.ndarray) -> None:
+        """
+        Single-pass FM phase discriminator: angle(s[n] * conj(s[n-1])).
+        
+        Args:
+            iq_re: Real (I) component of the IQ samples
+            iq_im: Imaginary (Q) component of the IQ samples
+            out: Preallocated float32 output of length len(iq_re) - 1
+        """
+        for n in prange(1, iq_re.shape[0]):
+            a = iq_re[n] * iq_re[n - 1] + iq_im[n] * iq_im[n - 1]
+            b = iq_im[n] * iq_re[n - 1] - iq_re[n] * iq_im[n - 1]
+            out[n - 1] = _fast_atan2(b, a)
+    
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _am_envelope_dc(iq_re: np.ndarray, iq_im: np.ndarray, out: np.ndarray) -> None:
+        """
+        AM envelope detector with DC removal: |s[n]| - mean(|s|).
+        
+        Args:
+            iq_re: Real (I) component of the IQ samples
+            iq_im: Imaginary (Q) component of the IQ samples
+            out: Preallocated float32 output of length len(iq_re)
+        """
+        total = 0.0
+        for n in prange(iq_re.shape[0]):
+            env = math.sqrt(iq_re[n] * iq_re[n] + iq_im[n] * iq_im[n])
+            out[n] = env
+            total += env
+        
+        mean = total / iq_re.shape[0]
+        for n in prange(iq_re.shape[0]):
+            out[n] -= mean
+    
+    @njit(cache=True, fastmath=True)
+    def _float_to_int16(x: np.ndarray, out: np.ndarray) -> None:
+        """
+        Scale [-1, 1] float audio to int16 with clipping in one pass.
+        
+        Args:
+            x: Float32 audio samples
+            out: Preallocated int16 output of the same length
+        """
+        for n in range(x.shape[0]):
+            v = x[n] * 32767.0
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            out[n] = np.int16(v)
+    
+    def _make_fir_kernel(taps: np.ndarray, decimation: int) -> Callable[[np.ndarray, np.ndarray], None]:
+        """
+        Build a polyphase FIR decimator specialized for one tap set and factor.
+        
+        The taps, tap count and decimation are compile-time constants of the
+        returned kernel, so each output sample is a straight-line dot product.
+        
+        Args:
+            taps: Float32 lowpass taps (odd length)
+            decimation: Integer decimation factor
+            
+        Returns:
+            Jitted function kernel(x, out) writing ceil(len(x) / decimation) samples
+        """
+        num_taps = taps.shape[0]
+        delay = (num_taps - 1) // 2
+        # Reversed taps so the inner loop walks the input forwards (vectorizes cleanly)
+        rev_taps = np.ascontiguousarray(taps[::-1])
+        
+        @njit(fastmath=True, parallel=True)
+        def kernel(x: np.ndarray, out: np.ndarray) -> None:
+            n_in = x.shape[0]
+            for k in prange(out.shape[0]):
+                # Output k is centred on input k * decimation (group delay removed)
+                start = k * decimation + delay - (num_taps - 1)
+                j_start = max(0, -start)
+                j_stop = min(num_taps, n_in - start)
+                acc = np.float32(0.0)
+                for j in range(j_start, j_stop):
+                    acc += rev_taps[j] * x[start + j]
+                out[k] = acc
+        
+        return kernel
+
+
 class FMDemodulator:
     """
     Multi-mode Demodulator class.
@@ -20,9 +151,48 @@ class FMDemodulator:
         self.sample_rate = sample_rate
         self.audio_rate = audio_rate
         self.volume = 1.0  # Default volume (0.0 to 1.0)
+        self.debug = False  # Print squelch power every 10th chunk when enabled
+        self._chunk_counter = 0
+        
+        # Linear squelch threshold, recomputed only when the dB setting changes
+        self._squelch_db: float = float('nan')
+        self._squelch_lin: float = 0.0
         
         # Calculate initial decimation factor (can be overridden in demodulate)
         self.decimation = int(sample_rate / audio_rate)
+        
+        # Demodulation method lookup by mode name
+        self._dispatch = {
+            "NFM": self._demodulate_nfm,
+            "WFM": self._demodulate_wfm,
+            "AM": self._demodulate_am,
+        }
+        
+        # Shared read-only zeros returned for squelched chunks
+        self._silence_buf: np.ndarray = np.zeros(0, dtype=np.float32)
+        
+        # Scratch buffers for intermediate results, grown to the largest chunk seen
+        self._scratch: dict[str, np.ndarray] = {}
+        
+        # Anti-aliasing FIR taps keyed by decimation factor
+        self._fir_cache: dict[int, np.ndarray] = {}
+        # Numba FIR decimators specialized per decimation factor
+        self._fir_kernels: dict[int, Callable[[np.ndarray, np.ndarray], None]] = {}
+        # Two-stage (D1, D2) factorizations keyed by total decimation factor
+        self._stage_cache: dict[int, tuple[int, int]] = {}
+        
+        # Post-decimation audio filters, designed once with state kept across chunks
+        # (float32 coefficients and state so lfilter output stays single precision)
+        # WFM: de-emphasis (75 microsecond time constant, ~2.1 kHz corner)
+        b, a = scipy.signal.butter(1, 2100, btype='low', fs=audio_rate)
+        self._wfm_deemph = (b.astype(np.float32), a.astype(np.float32))
+        self._wfm_zi: np.ndarray = np.zeros(len(b) - 1, dtype=np.float32)
+        # AM: 5 kHz audio low-pass
+        b, a = scipy.signal.butter(1, 5000, btype='low', fs=audio_rate)
+        self._am_lpf = (b.astype(np.float32), a.astype(np.float32))
+        self._am_zi: np.ndarray = np.zeros(len(b) - 1, dtype=np.float32)
+        # (mode, input rate) the filter state above belongs to (see _sync_filter_state)
+        self._stream_key: Optional[tuple] = None
     
     def set_volume(self, volume: float) -> None:
         """
@@ -32,13 +202,307 @@ class FMDemodulator:
             volume: Float between 0.0 and 1.0
         """
         self.volume = max(0.0, min(1.0, volume))
+    
+    def _get_scratch(self, name: str, size: int, dtype: type = np.float32) -> np.ndarray:
+        """
+        Get a reusable scratch buffer, avoiding per-chunk allocation.
+        
+        The returned array is only valid until the next call with the same name.
+        
+        Args:
+            name: Buffer identifier
+            size: Required number of elements
+            dtype: Element type (default float32)
+            
+        Returns:
+            Array view of exactly `size` elements
+        """
+        buf = self._scratch.get(name)
+        if buf is None or buf.shape[0] < size or buf.dtype != dtype:
+            buf = np.empty(size, dtype=dtype)
+            self._scratch[name] = buf
+        return buf[:size]
+    
+    def _silence(self, num_samples: int, sample_rate: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get silent audio for a squelched chunk without allocating.
+        
+        Without out, returns a read-only view into a shared zero buffer;
+        callers must copy it before modifying.
+        
+        Args:
+            num_samples: Number of input IQ samples in the chunk
+            sample_rate: Current SDR sample rate (if different from init)
+            out: Optional caller buffer to zero-fill instead
+            
+        Returns:
+            Float32 zeros of length num_samples // decimation (capped at len(out))
+        """
+        current_rate = sample_rate if sample_rate else self.sample_rate
+        num_output_samples = num_samples // int(current_rate / self.audio_rate)
+        
+        if out is not None:
+            out = out[:num_output_samples]
+            out.fill(0)
+            return out
+        
+        if self._silence_buf.shape[0] < num_output_samples:
+            self._silence_buf = np.zeros(num_output_samples, dtype=np.float32)
+            self._silence_buf.flags.writeable = False
+        return self._silence_buf[:num_output_samples]
+    
+    def _sync_filter_state(self, mode: str, sample_rate: float) -> None:
+        """
+        Reset the WFM/AM filter state when the mode or input rate changes.
+        
+        The lfilter state carries across chunks of one stream; after a switch
+        the first chunk starts from rest instead of the previous stream's state.
+        
+        Args:
+            mode: Demodulation mode of the upcoming chunk
+            sample_rate: Current SDR sample rate (if different from init)
+        """
+        key = (mode, sample_rate if sample_rate else self.sample_rate)
+        if key != self._stream_key:
+            self._stream_key = key
+            self._wfm_zi = np.zeros_like(self._wfm_zi)
+            self._am_zi = np.zeros_like(self._am_zi)
+    
+    @staticmethod
+    def _sum_squares(samples: np.ndarray) -> float:
+        """
+        Sum of |s|^2 over a chunk (single BLAS dot, no sqrt or temporaries).
+        
+        Args:
+            samples: Complex numpy array of IQ data
+            
+        Returns:
+            Total sample energy
+        """
+        return float(np.vdot(samples, samples).real)
+    
+    def _squelch_threshold(self, squelch_threshold_db: float) -> float:
+        """
+        Convert a squelch level to linear mean power, cached per dB value.
+        
+        Args:
+            squelch_threshold_db: Power threshold in dB
+            
+        Returns:
+            Linear threshold comparable to sum_sq / N
+        """
+        if squelch_threshold_db != self._squelch_db:
+            self._squelch_db = squelch_threshold_db
+            self._squelch_lin = 10 ** (squelch_threshold_db / 10) - 1e-10
+        return self._squelch_lin
+    
+    def _is_squelched(self, samples: np.ndarray, squelch_threshold_db: float) -> bool:
+        """
+        Check whether the chunk power is below the squelch threshold.
+        
+        Compares the sum of squares against a cached linear threshold so no
+        log10 is needed on the hot path.
+        
+        Args:
+            samples: Complex numpy array of IQ data
+            squelch_threshold_db: Power threshold in dB
+            
+        Returns:
+            True if the chunk should be silenced
+        """
+        sum_sq = self._sum_squares(samples)
+        
+        if self.debug:
+            self._chunk_counter += 1
+            if self._chunk_counter % 10 == 0:
+                power_db = 10.0 * math.log10(sum_sq / samples.size + 1e-10)
+                print(f"DEBUG: Noise: {power_db:.2f} dB | Limit: {squelch_threshold_db:.2f} dB")
+        
+        return sum_sq < self._squelch_threshold(squelch_threshold_db) * samples.size
+    
+    def _get_taps(self, decimation: int) -> np.ndarray:
+        """
+        Get the anti-aliasing FIR taps for a decimation factor (designed once).
+        
+        Args:
+            decimation: Integer decimation factor
+            
+        Returns:
+            Float32 array of 20 * decimation + 1 lowpass taps
+        """
+        taps = self._fir_cache.get(decimation)
+        if taps is None:
+            # Same design scipy.signal.decimate uses for ftype='fir'
+            taps = scipy.signal.firwin(20 * decimation + 1, 1.0 / decimation, window='hamming').astype(np.float32)
+            self._fir_cache[decimation] = taps
+        return taps
+    
+    def _get_fir_kernel(self, decimation: int) -> Callable[[np.ndarray, np.ndarray], None]:
+        """
+        Get the Numba FIR decimator for a decimation factor (built once).
+        
+        Args:
+            decimation: Integer decimation factor
+            
+        Returns:
+            Specialized kernel(x, out)
+        """
+        kernel = self._fir_kernels.get(decimation)
+        if kernel is None:
+            kernel = _make_fir_kernel(self._get_taps(decimation), decimation)
+            self._fir_kernels[decimation] = kernel
+        return kernel
+    
+    def _fir_decimate(self, x: np.ndarray, decimation: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Lowpass filter and downsample using a polyphase FIR.
+        
+        Only the retained output samples are computed, instead of filtering
+        at the full input rate and discarding most of the result. Uses the
+        specialized Numba kernel when available; otherwise long filters on
+        large chunks use overlap-add FFT convolution and the rest upfirdn.
+        
+        Args:
+            x: Real input signal
+            decimation: Integer decimation factor
+            out: Optional float32 buffer to write the result into (the Numba
+                kernel computes straight into it)
+            
+        Returns:
+            Decimated signal of length ceil(len(x) / decimation), capped at
+            len(out) (a view of out when given)
+        """
+        num_out = -(-len(x) // decimation)
+        if NUMBA_AVAILABLE:
+            if out is None:
+                out = np.empty(num_out, dtype=np.float32)
+            out = out[:num_out]
+            self._get_fir_kernel(decimation)(x, out)
+            return out
+        
+        taps = self._get_taps(decimation)
+        if len(taps) > FFT_CONV_MIN_TAPS and len(x) >= FFT_CONV_MIN_SAMPLES:
+            # Long filters on large chunks: overlap-add FFT convolution is cheaper
+            y = np.ascontiguousarray(scipy.signal.oaconvolve(x, taps, mode='full')[::decimation])
+        else:
+            y = scipy.signal.upfirdn(taps, x, down=decimation)
+        
+        # Trim the filter group delay so output stays aligned with the input
+        delay = (len(taps) - 1) // (2 * decimation)
+        y = y[delay:delay + num_out]
+        if out is None:
+            return y
+        out = out[:num_out]
+        np.copyto(out, y[:len(out)], casting='unsafe')
+        return out
+    
+    def _get_stages(self, decimation: int) -> tuple[int, int]:
+        """
+        Factor a decimation into two stages D1 * D2 with D1 >= D2, as close to equal as possible.
+        
+        Args:
+            decimation: Integer decimation factor
+            
+        Returns:
+            Tuple (D1, D2); (decimation, 1) if the factor is prime
+        """
+        stages = self._stage_cache.get(decimation)
+        if stages is None:
+            d2 = max(d for d in range(1, math.isqrt(decimation) + 1) if decimation % d == 0)
+            stages = (decimation // d2, d2)
+            self._stage_cache[decimation] = stages
+        return stages
+    
+    def _two_stage_decimate(self, x: np.ndarray, decimation: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Decimate in two cascaded polyphase FIR stages (e.g. 20 = 5 x 4).
+        
+        Each stage needs far fewer taps than a single sharp filter at the full
+        input rate, so the multiplies per output sample drop considerably.
+        
+        Args:
+            x: Real input signal
+            decimation: Integer decimation factor
+            out: Optional float32 buffer for the final stage's output
+            
+        Returns:
+            Decimated signal of length ceil(ceil(len(x) / D1) / D2), capped at
+            len(out) (a view of out when given)
+        """
+        d1, d2 = self._get_stages(decimation)
+        if d2 == 1:
+            return self._fir_decimate(x, d1, out)
+        stage1 = self._get_scratch("stage1", -(-len(x) // d1))
+        return self._fir_decimate(self._fir_decimate(x, d1, stage1), d2, out)
+    
+    def _split_iq(self, samples: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        De-interleave complex64 IQ into contiguous float32 I and Q arrays.
+        
+        The Numba kernels vectorize cleanly over separate (SoA) arrays but not
+        over the interleaved complex layout.
+        
+        Args:
+            samples: Complex64 numpy array of IQ data
+            
+        Returns:
+            Tuple (I, Q) of scratch float32 arrays, valid until the next chunk
+        """
+        iq_re = self._get_scratch("iq_re", len(samples))
+        iq_im = self._get_scratch("iq_im", len(samples))
+        np.copyto(iq_re, samples.real)
+        np.copyto(iq_im, samples.imag)
+        return iq_re, iq_im
+    
+    def _discriminate(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Compute the instantaneous phase difference between consecutive samples.
+        
+        Args:
+            samples: Complex numpy array of IQ data
+            
+        Returns:
+            Float32 array of length len(samples) - 1 (radians per sample)
+        """
+        out = self._get_scratch("demod", len(samples) - 1)
+        
+        if not NUMBA_AVAILABLE:
+            x = self._get_scratch("product", len(samples) - 1, np.complex64)
+            np.conjugate(samples[:-1], out=x)
+            np.multiply(samples[1:], x, out=x)
+            np.arctan2(x.imag, x.real, out=out)
+            return out
+        
+        _fm_discriminate(*self._split_iq(samples), out)
+        return out
+
+    def _envelope(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Compute the AM envelope with its DC component removed.
+        
+        Args:
+            samples: Complex numpy array of IQ data
+            
+        Returns:
+            Float32 array of length len(samples)
+        """
+        out = self._get_scratch("demod", len(samples))
+        
+        if not NUMBA_AVAILABLE:
+            np.abs(samples, out=out)
+            np.subtract(out, np.mean(out), out=out)
+            return out
+        
+        _am_envelope_dc(*self._split_iq(samples), out)
+        return out
 
     def demodulate(
         self, 
         samples: np.ndarray, 
         sample_rate: float = None, 
         squelch_threshold_db: float = -80.0,
-        mode: str = "NFM"
+        mode: str = "NFM",
+        return_dtype: type = np.float32
     ) -> np.ndarray:
         """
         Perform demodulation on raw IQ samples (FM or AM).
@@ -48,41 +512,229 @@ class FMDemodulator:
             sample_rate: Current SDR sample rate (if different from init)
             squelch_threshold_db: Power threshold in dB. Signals below this are silenced.
             mode: Demodulation mode ("NFM", "WFM", or "AM")
+            return_dtype: np.float32 (default) or np.int16 for full-scale 16-bit audio
             
         Returns:
-            Numpy array of float32 audio samples
+            Numpy array of audio samples (read-only shared zeros when squelched as float32)
         """
         if len(samples) == 0:
-            return np.array([], dtype=np.float32)
+            return np.array([], dtype=return_dtype)
+        self._sync_filter_state(mode, sample_rate)
+        
+        # Keep the whole pipeline in single precision (halves memory traffic)
+        if samples.dtype != np.complex64:
+            samples = samples.astype(np.complex64, copy=False)
+        
+        # Dispatch to appropriate demodulation method (NFM by default)
+        audio = self._dispatch.get(mode, self._demodulate_nfm)(samples, sample_rate, squelch_threshold_db)
+        
+        if return_dtype == np.int16:
+            return self._to_int16(audio)
+        return audio
+    
+    def demodulate_into(
+        self,
+        samples: np.ndarray,
+        out: np.ndarray,
+        sample_rate: float = None,
+        squelch_threshold_db: float = -80.0,
+        mode: str = "NFM"
+    ) -> int:
+        """
+        Demodulate into a caller-owned buffer instead of returning a new array.
+        
+        The output format follows out.dtype (np.float32 or np.int16), so an
+        audio loop can reuse one buffer for every block it writes to the stream.
+        The final decimation stage writes into out (float32) or into a reused
+        float32 scratch that is then converted into out (int16), and squelched
+        chunks just zero-fill out.
+        
+        Args:
+            samples: Complex numpy array of IQ data
+            out: Preallocated float32 or int16 buffer; output beyond len(out) is dropped
+            sample_rate: Current SDR sample rate (if different from init)
+            squelch_threshold_db: Power threshold in dB. Signals below this are silenced.
+            mode: Demodulation mode ("NFM", "WFM", or "AM")
+            
+        Returns:
+            Number of audio samples written to the start of out
+        """
+        if len(samples) == 0:
+            return 0
+        self._sync_filter_state(mode, sample_rate)
+        if samples.dtype != np.complex64:
+            samples = samples.astype(np.complex64, copy=False)
+        
+        if self._is_squelched(samples, squelch_threshold_db):
+            return len(self._silence(len(samples), sample_rate, out))
+        
+        # Squelch is decided; the mode method writes its final stage into work
+        work = out if out.dtype == np.float32 else self._get_scratch("audio", len(out))
+        audio = self._dispatch.get(mode, self._demodulate_nfm)(samples, sample_rate, None, work)
+        n = len(audio)
+        
+        if out.dtype == np.int16:
+            self._to_int16(audio, out[:n])
+        return n
+    
+    def _to_int16(self, audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Convert float audio in [-1, 1] to clipped int16 samples.
+        
+        Args:
+            audio: Float32 audio samples
+            out: Optional preallocated int16 buffer of the same length
+            
+        Returns:
+            Int16 array of the same length (out, when given)
+        """
+        if out is None:
+            out = np.empty(len(audio), dtype=np.int16)
+        
+        if not NUMBA_AVAILABLE:
+            np.copyto(out, np.clip(audio * 32767.0, -32768, 32767), casting='unsafe')
+            return out
+        
+        _float_to_int16(audio, out)
+        return out
+    
+    def squelch_mask(self, samples_2d: np.ndarray, squelch_threshold_db: float) -> np.ndarray:
+        """
+        Decide squelch for K chunks at once.
+        
+        The per-chunk sums of squares come from a single einsum reduction
+        instead of one call per chunk.
+        
+        Args:
+            samples_2d: Complex array of shape (K, N)
+            squelch_threshold_db: Power threshold in dB
+            
+        Returns:
+            Boolean array of shape (K,), True where the chunk should be silenced
+        """
+        sum_sq = (np.einsum('ij,ij->i', samples_2d.real, samples_2d.real)
+                  + np.einsum('ij,ij->i', samples_2d.imag, samples_2d.imag))
+        return sum_sq < self._squelch_threshold(squelch_threshold_db) * samples_2d.shape[1]
+    
+    def demodulate_batch(
+        self,
+        samples_2d: np.ndarray,
+        sample_rate: float = None,
+        squelch_threshold_db: float = -80.0,
+        mode: str = "NFM"
+    ) -> np.ndarray:
+        """
+        Demodulate K independent chunks (e.g. separate scan windows) in one pass.
+        
+        Every stage runs along axis=-1 of the whole (K, N) array: discriminator
+        or envelope per row, FIR decimation with upfirdn(axis=-1), and the
+        WFM/AM audio filter per row. Each row starts from rest and no filter
+        state carries from one row to the next, so rows need not be consecutive
+        in time and a squelched row never leaks into an open one. Row i matches
+        demodulate() on chunk i with fresh filter state (up to the Numba atan2
+        approximation). Squelch is decided per row; only open rows are processed.
+        
+        Args:
+            samples_2d: Complex array of shape (K, N); N must be a multiple of the decimation factor
+            sample_rate: Current SDR sample rate (if different from init)
+            squelch_threshold_db: Power threshold in dB. Chunks below this are silenced.
+            mode: Demodulation mode ("NFM", "WFM", or "AM")
+            
+        Returns:
+            Float32 audio array of shape (K, N / decimation)
+            
+        Raises:
+            ValueError: If N is not a multiple of the decimation factor
+        """
+        num_chunks, chunk_len = samples_2d.shape
+        current_rate = sample_rate if sample_rate else self.sample_rate
+        decimation = int(current_rate / self.audio_rate)
+        if chunk_len % decimation:
+            raise ValueError(
+                f"Chunk length {chunk_len} is not a multiple of the decimation factor {decimation}"
+            )
+        
+        audio = np.zeros((num_chunks, chunk_len // decimation), dtype=np.float32)
+        if num_chunks == 0:
+            return audio
+        
+        if samples_2d.dtype != np.complex64:
+            samples_2d = samples_2d.astype(np.complex64, copy=False)
+        
+        open_rows = ~self.squelch_mask(samples_2d, squelch_threshold_db)
+        if not open_rows.any():
+            return audio
+        rows = samples_2d[open_rows]
         
-        # Dispatch to appropriate demodulation method
         if mode == "AM":
-            return self._demodulate_am(samples, sample_rate, squelch_threshold_db)
-        elif mode == "WFM":
-            return self._demodulate_wfm(samples, sample_rate, squelch_threshold_db)
-        else:  # NFM (default)
-            return self._demodulate_nfm(samples, sample_rate, squelch_threshold_db)
-    
-    def _demodulate_nfm(self, samples: np.ndarray, sample_rate: float, squelch_threshold_db: float) -> np.ndarray:
-        """Narrow FM demodulation (standard FM radio)."""
+            # Envelope with per-row DC removal, 5 kHz audio low-pass
+            demodulated = np.abs(rows)
+            demodulated -= demodulated.mean(axis=-1, keepdims=True)
+            y = self._fir_decimate_rows(demodulated, decimation)
+            b, a = self._am_lpf
+            y = scipy.signal.lfilter(b, a, y, axis=-1)
+            gain = 0.3
+        else:
+            # Phase discriminator within each row only
+            demodulated = np.angle(rows[:, 1:] * np.conj(rows[:, :-1]))
+            if mode == "WFM":
+                d1, d2 = self._get_stages(decimation)
+                y = self._fir_decimate_rows(demodulated, d1)
+                if d2 > 1:
+                    y = self._fir_decimate_rows(y, d2)
+                b, a = self._wfm_deemph
+                y = scipy.signal.lfilter(b, a, y, axis=-1)
+            else:
+                y = self._fir_decimate_rows(demodulated, decimation)
+            gain = 0.5
+        
+        audio[open_rows] = y * np.float32(self.volume * gain)
+        return audio
+    
+    def _fir_decimate_rows(self, x: np.ndarray, decimation: int) -> np.ndarray:
+        """
+        Row-wise _fir_decimate: same taps and group-delay trim, along axis=-1.
+        
+        Args:
+            x: Real input of shape (K, M)
+            decimation: Integer decimation factor
+            
+        Returns:
+            Decimated array of shape (K, ceil(M / decimation))
+        """
+        taps = self._get_taps(decimation)
+        y = scipy.signal.upfirdn(taps, x, down=decimation, axis=-1)
+        delay = (len(taps) - 1) // (2 * decimation)
+        return y[:, delay:delay + -(-x.shape[-1] // decimation)]
+    
+    def _demodulate_nfm(
+        self,
+        samples: np.ndarray,
+        sample_rate: float,
+        squelch_threshold_db: Optional[float],
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Narrow FM demodulation (standard FM radio).
+        
+        Args:
+            samples: Complex64 numpy array of IQ data
+            sample_rate: Current SDR sample rate (if different from init)
+            squelch_threshold_db: Power threshold in dB (None: already checked by the caller)
+            out: Optional float32 buffer the audio is written into
+            
+        Returns:
+            Float32 audio (a view of out when given)
+        """
         if len(samples) == 0:
             return np.array([], dtype=np.float32)
             
         # 1. Squelch Check (Power Calculation)
-        power_db = 10 * np.log10(np.mean(np.abs(samples)**2) + 1e-10)
-        
-        if np.random.random() < 0.1:
-            print(f"DEBUG: Noise: {power_db:.2f} dB | Limit: {squelch_threshold_db:.2f} dB")
-
-        if power_db < squelch_threshold_db:
-            current_rate = sample_rate if sample_rate else self.sample_rate
-            decimation = int(current_rate / self.audio_rate)
-            num_output_samples = len(samples) // decimation
-            return np.zeros(num_output_samples, dtype=np.float32)
+        if squelch_threshold_db is not None and self._is_squelched(samples, squelch_threshold_db):
+            return self._silence(len(samples), sample_rate, out)
 
         # 2. FM Demodulation
-        x = samples[1:] * np.conj(samples[:-1])
-        demodulated = np.angle(x)
+        demodulated = self._discriminate(samples)
         
         # 3. Decimation
         if sample_rate:
@@ -90,77 +742,96 @@ class FMDemodulator:
         else:
             decimation = self.decimation
             
-        audio = scipy.signal.decimate(demodulated, decimation, ftype='fir')
+        audio = self._fir_decimate(demodulated, decimation, out)
         
         # 4. Volume
-        audio = audio * (self.volume * 0.5)
-        
-        return audio.astype(np.float32)
+        audio *= np.float32(self.volume * 0.5)
+        return audio
     
-    def _demodulate_wfm(self, samples: np.ndarray, sample_rate: float, squelch_threshold_db: float) -> np.ndarray:
-        """Wide FM demodulation (broadcast FM, wider bandwidth ~200kHz)."""
+    def _demodulate_wfm(
+        self,
+        samples: np.ndarray,
+        sample_rate: float,
+        squelch_threshold_db: Optional[float],
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Wide FM demodulation (broadcast FM, wider bandwidth ~200kHz).
+        
+        Args:
+            samples: Complex64 numpy array of IQ data
+            sample_rate: Current SDR sample rate (if different from init)
+            squelch_threshold_db: Power threshold in dB (None: already checked by the caller)
+            out: Optional float32 buffer the audio is written into
+            
+        Returns:
+            Float32 audio (a view of out when given)
+        """
         if len(samples) == 0:
             return np.array([], dtype=np.float32)
         
         # 1. Squelch Check
-        power_db = 10 * np.log10(np.mean(np.abs(samples)**2) + 1e-10)
-        if power_db < squelch_threshold_db:
-            current_rate = sample_rate if sample_rate else self.sample_rate
-            decimation = int(current_rate / self.audio_rate)
-            num_output_samples = len(samples) // decimation
-            return np.zeros(num_output_samples, dtype=np.float32)
+        if squelch_threshold_db is not None and self._is_squelched(samples, squelch_threshold_db):
+            return self._silence(len(samples), sample_rate, out)
         
         # 2. FM Demodulation (same phase detector as NFM)
-        x = samples[1:] * np.conj(samples[:-1])
-        demodulated = np.angle(x)
+        demodulated = self._discriminate(samples)
         
-        # 3. Decimation with IIR filter for slightly wider passband than NFM
+        # 3. Two-stage decimation (the wide input bandwidth makes a single stage costly)
         if sample_rate:
             decimation = int(sample_rate / self.audio_rate)
         else:
             decimation = self.decimation
         
-        # Use IIR filter (allows wider bandwidth than FIR used in NFM)
-        audio = scipy.signal.decimate(demodulated, decimation, ftype='iir')
+        audio = self._two_stage_decimate(demodulated, decimation, out)
         
-        # 4. Apply de-emphasis filter (standard broadcast FM)
-        # 75 microsecond time constant for de-emphasis
-        b, a = scipy.signal.butter(1, 2100, btype='low', fs=self.audio_rate)
-        audio = scipy.signal.lfilter(b, a, audio)
-        
-        audio = audio * (self.volume * 0.5)
-        return audio.astype(np.float32)
+        # 4. Apply de-emphasis filter (standard broadcast FM), then volume back
+        # into the decimator's output buffer
+        b, a = self._wfm_deemph
+        filtered, self._wfm_zi = scipy.signal.lfilter(b, a, audio, zi=self._wfm_zi)
+        np.multiply(filtered, np.float32(self.volume * 0.5), out=audio)
+        return audio
     
-    def _demodulate_am(self, samples: np.ndarray, sample_rate: float, squelch_threshold_db: float) -> np.ndarray:
-        """Amplitude Modulation (AM) demodulation."""
+    def _demodulate_am(
+        self,
+        samples: np.ndarray,
+        sample_rate: float,
+        squelch_threshold_db: Optional[float],
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Amplitude Modulation (AM) demodulation.
+        
+        Args:
+            samples: Complex64 numpy array of IQ data
+            sample_rate: Current SDR sample rate (if different from init)
+            squelch_threshold_db: Power threshold in dB (None: already checked by the caller)
+            out: Optional float32 buffer the audio is written into
+            
+        Returns:
+            Float32 audio (a view of out when given)
+        """
         if len(samples) == 0:
             return np.array([], dtype=np.float32)
         
         # 1. Squelch Check
-        power_db = 10 * np.log10(np.mean(np.abs(samples)**2) + 1e-10)
-        if power_db < squelch_threshold_db:
-            current_rate = sample_rate if sample_rate else self.sample_rate
-            decimation = int(current_rate / self.audio_rate)
-            num_output_samples = len(samples) // decimation
-            return np.zeros(num_output_samples, dtype=np.float32)
-        
-        # 2. AM Demodulation: envelope detection
-        demodulated = np.abs(samples)
+        if squelch_threshold_db is not None and self._is_squelched(samples, squelch_threshold_db):
+            return self._silence(len(samples), sample_rate, out)
         
-        # 3. Remove DC component
-        demodulated = demodulated - np.mean(demodulated)
+        # 2. AM Demodulation: envelope detection with DC removal
+        demodulated = self._envelope(samples)
         
-        # 4. Decimation
+        # 3. Decimation
         if sample_rate:
             decimation = int(sample_rate / self.audio_rate)
         else:
             decimation = self.decimation
         
-        audio = scipy.signal.decimate(demodulated, decimation, ftype='fir')
-        
-        # 5. Apply low-pass filter for AM audio
-        b, a = scipy.signal.butter(1, 5000, btype='low', fs=self.audio_rate)
-        audio = scipy.signal.lfilter(b, a, audio)
+        audio = self._fir_decimate(demodulated, decimation, out)
         
-        audio = audio * (self.volume * 0.3)
-        return audio.astype(np.float32)
\ No newline at end of file
+        # 4. Apply low-pass filter for AM audio, then volume back into the
+        # decimator's output buffer
+        b, a = self._am_lpf
+        filtered, self._am_zi = scipy.signal.lfilter(b, a, audio, zi=self._am_zi)
+        np.multiply(filtered, np.float32(self.volume * 0.3), out=audio)
+        return audio
\ No newline at end of file
@@ -5,11 +5,15 @@ This module implements the main scanning thread that controls the SDR hardware,
 performs frequency sweeps, detects signals, and reports events back to the UI.
 """
 
+import math
 import threading
 import time
-from queue import Queue
-from typing import List, Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from typing import Deque, List, Dict, Any, Optional, Tuple
 import numpy as np
+from scipy import fft as sfft
+from scipy.signal import find_peaks
 from datetime import datetime
 
 # Audio availability flag
@@ -21,8 +25,43 @@ except ImportError:
     sd = None
     print("Warning: sounddevice not installed. Audio streaming disabled.")
 
+# pyFFTW availability flag (scan-mode FFT falls back to scipy.fft)
+PYFFTW_AVAILABLE = False
+try:
+    import pyfftw
+    pyfftw.interfaces.cache.enable()
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    pyfftw = None
+    print("Warning: pyfftw not installed. Using scipy.fft for scan analysis.")
+
 from src.core.sdr_driver import SdrDriver
-from src.core.demodulator import FMDemodulator
+from src.core.demodulator import FMDemodulator, NUMBA_AVAILABLE
+
+# Spectrum payloads in raw_data_slot carry power as int16 tenths of a dB
+SPECTRUM_DB_SCALE = 10
+
+# raw_data_slot payload: (frequencies_hz, power_int16, (f_min_hz, f_max_hz, p_min_db, p_max_db))
+SpectrumPayload = Tuple[np.ndarray, np.ndarray, Tuple[float, float, float, float]]
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _power_db_shifted(fft_result: np.ndarray, out: np.ndarray) -> None:
+        """
+        Fused |X|^2 -> dB with fftshift folded into the store index.
+        
+        Args:
+            fft_result: Complex FFT output in natural order
+            out: Preallocated float32 output, written in DC-centred order
+        """
+        n = fft_result.shape[0]
+        half = n // 2
+        for i in prange(n):
+            re = fft_result[i].real
+            im = fft_result[i].imag
+            out[(i + half) % n] = 10.0 * math.log10(re * re + im * im + 1e-10)
 
 
 class Scanner(threading.Thread):
@@ -37,24 +76,34 @@ class Scanner(threading.Thread):
     def __init__(
         self,
         driver: SdrDriver,
-        result_queue: Queue,
-        bands: List[Dict[str, Any]],
-        raw_data_queue: Optional[Queue] = None
+        result_queue: Deque[Dict[str, Any]],
+        bands: List[Dict[str, Any]]
     ) -> None:
         """
         Initialize the scanner thread.
         
         Args:
             driver: SdrDriver instance for hardware control
-            result_queue: Queue for sending detection events to UI
+            result_queue: Deque for sending detection events to UI (scanner
+                appends, UI pops from the left)
             bands: List of band configuration dictionaries from bands.json
-            raw_data_queue: Optional queue for real-time spectrum data visualization
         """
         super().__init__(daemon=True)
         self.driver: SdrDriver = driver
-        self.result_queue: Queue = result_queue
+        self.result_queue: Deque[Dict[str, Any]] = result_queue
         self.bands: List[Dict[str, Any]] = bands
-        self.raw_data_queue: Optional[Queue] = raw_data_queue
+        
+        # Enabled bands with their fields pre-extracted, rebuilt only when bands change:
+        # (start_hz, end_hz, step_hz, gain, dwell_s, threshold_db, band_id, band_name),
+        # gain being 0 for auto
+        self._active_bands: List[Tuple[float, float, float, float, float, float, str, str]] = []
+        self._rebuild_active_bands()
+        
+        # Single-slot spectrum handoff to the UI: the scanner only stores a new
+        # SpectrumPayload when the slot is empty, and the UI empties it after
+        # reading. Plain attribute stores are atomic under the GIL, and with one
+        # producer and one consumer no lock or Queue mutex is needed.
+        self.raw_data_slot: Optional[SpectrumPayload] = None
         
         # Pause/Resume control using threading.Event
         # When event is SET -> scanning active
@@ -63,8 +112,13 @@ class Scanner(threading.Thread):
         # Start in paused state
         self.scan_paused.clear()
         
+        # Set while the scanner thread is parked on scan_paused and not touching
+        # the SDR; stop_scan() waits on it so callers may reconfigure the device
+        self._scan_idle: threading.Event = threading.Event()
+        
         # Default scanning parameters
-        self.num_samples: int = 2048  # Number of IQ samples per read
+        self.num_samples: int = 16384  # IQ samples per wideband segment FFT (~146 Hz bins at 2.4 MHz)
+        self.segment_usable_fraction: float = 0.9  # Central part of each capture analyzed (skips roll-off edges)
         self.sample_rate_hz: float = 2.4e6  # 2.4 MHz sample rate
         self.manual_sample_rate_hz: float = 1.92e6  # 1.92 MHz for manual mode (divisible for 48kHz)
         
@@ -73,6 +127,28 @@ class Scanner(threading.Thread):
         self._current_threshold: float = 10.0  # Default threshold in dB
         self.squelch_value: float = -80.0  # Squelch threshold in dB (default: -80 dB)
         self._lock: threading.Lock = threading.Lock()  # Thread-safe parameter updates
+        self._scan_initialized: bool = False  # Scan-mode sample rate applied to the device
+        
+        # Scan-mode spectrum buffers, reused across tune steps
+        self._abs2_buf: np.ndarray = np.empty(self.num_samples, dtype=np.float32)
+        self._power_buf: np.ndarray = np.empty(self.num_samples, dtype=np.float32)
+        self._rel_freqs: np.ndarray = self._build_relative_freqs(self.num_samples)
+        
+        # Planned in-place FFTW transform on an aligned buffer (None -> scipy.fft)
+        self._fft_in: Optional[np.ndarray] = None
+        self._fft_plan = None
+        self._build_fft_plan(self.num_samples)
+        
+        # Per-segment, per-bin running average of the power spectrum used as noise
+        # floor, keyed by (band_id, segment center in Hz): a band is swept in several
+        # segments, and bin k covers a different RF frequency in each of them
+        self._noise_ema: Dict[Tuple[str, int], np.ndarray] = {}
+        self._noise_ema_alpha: float = 0.05
+        
+        # Single worker that runs the FFT analysis of one bin while the next is read over USB
+        self._analysis_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="scan-analysis"
+        )
         
         # Spectrum update throttling (to prevent UI lag)
         self._spectrum_counter: int = 0
@@ -82,6 +158,7 @@ class Scanner(threading.Thread):
         self.manual_mode: bool = False
         self.manual_freq: float = 144.0e6  # Default: 2m amateur band
         self.buffer_size: int = 133120  # Default buffer size (130 * 1024, divisible by 20)
+        self._audio_out_buf: np.ndarray = np.empty(self.buffer_size // 20, dtype=np.int16)  # Reused int16 audio block
         self.demod_mode: str = "NFM"  # Demodulation mode: NFM, WFM, or AM
         self.spectrum_enabled: bool = False  # Whether to generate spectrum data (disabled by default)
         
@@ -118,7 +195,7 @@ class Scanner(threading.Thread):
                     samplerate=48000,
                     blocksize=0,
                     latency='high',
-                    dtype='float32'
+                    dtype='int16'  # 16-bit output halves bytes moved to the audio device
                 )
                 self.audio_stream.start()
                 print("Audio stream initialized with high latency mode")
@@ -142,10 +219,13 @@ class Scanner(threading.Thread):
         print("Scanner thread started (paused)")
         
         while True:
-            # Check if scanning is paused
+            # Block while paused (zero CPU, resumes as soon as the event is set).
+            # Idle is cleared before re-checking the pause flag, so a stop_scan()
+            # racing with the wakeup either sees us busy and waits, or we bail here.
+            self._scan_idle.set()
+            self.scan_paused.wait()
+            self._scan_idle.clear()
             if not self.scan_paused.is_set():
-                # Paused state - sleep and continue
-                time.sleep(0.1)
                 continue
             
             # Check if in manual mode (audio streaming)
@@ -159,17 +239,17 @@ class Scanner(threading.Thread):
         Scan mode: Iterate through bands and perform FFT detection.
         """
         # Initialize hardware on first active scan cycle
-        if self.driver.is_connected and not hasattr(self, '_initialized'):
+        if self.driver.is_connected and not self._scan_initialized:
             if self.driver.set_sample_rate(self.sample_rate_hz):
-                self._initialized = True
+                self._scan_initialized = True
                 print("Scanner initialized (scan mode)")
             else:
                 print("Failed to set sample rate")
                 time.sleep(1.0)
                 return
         
-        # Iterate through all configured bands
-        for band in self.bands:
+        # Iterate through the enabled bands
+        for params in self._active_bands:
             # Check pause state during band iteration
             if not self.scan_paused.is_set():
                 break
@@ -178,12 +258,49 @@ class Scanner(threading.Thread):
             if self.manual_mode:
                 break
             
-            # Skip disabled bands
+            # Scan the frequency band
+            self._scan_band(params)
+    
+    def _rebuild_active_bands(self) -> None:
+        """
+        Rebuild the list of enabled bands with their fields pre-extracted.
+        
+        Called when the band list changes, so the scan loop iterates plain
+        tuples instead of filtering and reading band dicts on every sweep.
+        """
+        active: List[Tuple[float, float, float, float, float, float, str, str]] = []
+        for band in self.bands:
             if not band.get("enabled", False):
                 continue
             
-            # Scan the frequency band
-            self._scan_band(band)
+            gain = band.get("gain", "auto")
+            if isinstance(gain, str) and gain.lower() == "auto":
+                gain = 0.0  # 0 triggers auto gain
+            
+            active.append((
+                float(band["start_freq_hz"]),
+                float(band["end_freq_hz"]),
+                float(band["step_size_hz"]),
+                float(gain),
+                band.get("dwell_time_ms", 250) / 1000.0,
+                float(band["threshold_db"]),
+                band.get("id", "unknown"),
+                band.get("name", "Unknown Band")
+            ))
+        
+        # Single reference swap, so the scan loop sees either the old or the new list
+        self._active_bands = active
+    
+    def set_bands(self, bands: List[Dict[str, Any]]) -> None:
+        """
+        Replace the band configuration (e.g., after enabling or disabling bands).
+        
+        Args:
+            bands: List of band configuration dictionaries
+        """
+        with self._lock:
+            self.bands = bands
+            self._rebuild_active_bands()
     
     def _manual_mode_loop(self) -> None:
         """
@@ -195,8 +312,9 @@ class Scanner(threading.Thread):
             return
         
         # Tune to manual frequency
-        if not self.driver.tune(self.manual_freq):
-            print(f"Failed to tune to {self.manual_freq/1e6:.3f} MHz")
+        tuned_freq: float = self.manual_freq
+        if not self.driver.tune(tuned_freq):
+            print(f"Failed to tune to {tuned_freq/1e6:.3f} MHz")
             return
         
         # Force sample rate to 960 kHz for clean 20x decimation to 48 kHz
@@ -212,6 +330,12 @@ class Scanner(threading.Thread):
         
         while self.scan_paused.is_set() and self.manual_mode:
             try:
+                # Frequency changes from the UI are applied here, on the thread
+                # that owns the SDR (a float read; set_manual_freq stores it)
+                if self.manual_freq != tuned_freq:
+                    tuned_freq = self.manual_freq
+                    self.driver.tune(tuned_freq)
+                
                 # Read samples using dynamic buffer size (divisible by 20)
                 samples = self.driver.read_samples(self.buffer_size)
                 
@@ -219,21 +343,26 @@ class Scanner(threading.Thread):
                     time.sleep(0.01)
                     continue
                 
-                # Demodulate FM to audio (pass sample rate and squelch)
-                audio_data = self.demodulator.demodulate(
-                    samples, 
+                # Grow the reused audio block if the buffer size was raised
+                if self._audio_out_buf.shape[0] < len(samples) // 20:
+                    self._audio_out_buf = np.empty(len(samples) // 20, dtype=np.int16)
+                
+                # Demodulate FM to int16 audio in the reused block (pass sample rate and squelch)
+                num_audio: int = self.demodulator.demodulate_into(
+                    samples,
+                    self._audio_out_buf,
                     sample_rate=960000,
                     squelch_threshold_db=self.squelch_value,
                     mode=self.demod_mode
                 )
                 
-                # Stream audio (non-blocking write)
-                if len(audio_data) > 0:
-                    self.audio_stream.write(audio_data)
+                # Stream audio (write copies into PortAudio's buffer, so the block can be reused)
+                if num_audio > 0:
+                    self.audio_stream.write(self._audio_out_buf[:num_audio])
                 
                 # Update spectrum data periodically (less frequently to reduce load)
                 spectrum_counter += 1
-                if self.spectrum_enabled and spectrum_counter >= spectrum_update_interval and self.raw_data_queue is not None and self.raw_data_queue.empty():
+                if self.spectrum_enabled and spectrum_counter >= spectrum_update_interval and self.raw_data_slot is None:
                     spectrum_counter = 0
                     self._generate_spectrum_data(samples)
             
@@ -243,7 +372,7 @@ class Scanner(threading.Thread):
     
     def _generate_spectrum_data(self, samples: np.ndarray) -> None:
         """
-        Generate spectrum data from IQ samples and send to raw_data_queue.
+        Generate spectrum data from IQ samples and publish it in raw_data_slot.
         Uses aggressive downsampling and reduced resolution to minimize CPU load.
         
         Args:
@@ -265,7 +394,7 @@ class Scanner(threading.Thread):
             
             # Calculate power spectrum in dB
             power_spectrum: np.ndarray = 10 * np.log10(
-                np.abs(fft_shifted) ** 2 + 1e-10
+                fft_shifted.real ** 2 + fft_shifted.imag ** 2 + 1e-10
             )
             
             # Further reduce resolution by averaging bins (every 4 bins = 4x reduction)
@@ -278,66 +407,166 @@ class Scanner(threading.Thread):
                 -fft_size // 2, fft_size // 2, 4
             ) * freq_bin_width
             
-            # Put spectrum data into queue (non-blocking)
-            try:
-                self.raw_data_queue.put_nowait((frequencies, power_spectrum))
-            except:
-                pass  # Queue full, skip this update
+            # Publish spectrum data, quantized to 0.1 dB
+            self.raw_data_slot = self._spectrum_payload(frequencies, power_spectrum)
         
         except Exception as e:
             print(f"Error generating spectrum data: {e}")
     
-    def _scan_band(self, band: Dict[str, Any]) -> None:
+    @staticmethod
+    def _quantize_spectrum(power_spectrum: np.ndarray) -> np.ndarray:
         """
-        Scan a single frequency band.
+        Quantize a dB power spectrum to int16 tenths of a dB for the UI queue.
         
         Args:
-            band: Band configuration dictionary
-        """
-        start_freq: float = band["start_freq_hz"]
-        end_freq: float = band["end_freq_hz"]
-        step_size: float = band["step_size_hz"]
-        gain: float = band.get("gain", "auto")
-        dwell_time_ms: float = band.get("dwell_time_ms", 250)
-        threshold_db: float = band["threshold_db"]
-        
-        # Set gain for this band
-        if isinstance(gain, str) and gain.lower() == "auto":
-            self.driver.set_gain(0)  # 0 triggers auto gain
-        else:
-            self.driver.set_gain(float(gain))
+            power_spectrum: Power spectrum in dB
         
-        # Iterate through frequencies in the band
-        current_freq: float = start_freq
-        while current_freq <= end_freq and self.scan_paused.is_set():
-            # Tune to frequency
+        Returns:
+            New int16 array of power_spectrum * SPECTRUM_DB_SCALE
+        """
+        return np.rint(power_spectrum * SPECTRUM_DB_SCALE).astype(np.int16)
+    
+    @classmethod
+    def _spectrum_payload(cls, frequencies: np.ndarray, power_spectrum: np.ndarray) -> SpectrumPayload:
+        """
+        Build the raw_data_slot payload, with the axis bounds computed here on the
+        scanner thread so the UI doesn't need its own min/max passes.
+        
+        Args:
+            frequencies: Ascending bin frequencies in Hz
+            power_spectrum: Power spectrum in dB
+        
+        Returns:
+            (frequencies, quantized power, (f_min_hz, f_max_hz, p_min_db, p_max_db))
+        """
+        power_q = cls._quantize_spectrum(power_spectrum)
+        bounds = (
+            float(frequencies[0]),
+            float(frequencies[-1]),
+            float(power_q.min()) / SPECTRUM_DB_SCALE,
+            float(power_q.max()) / SPECTRUM_DB_SCALE
+        )
+        return frequencies, power_q, bounds
+    
+    def _scan_band(self, params: Tuple[float, float, float, float, float, float, str, str]) -> None:
+        """
+        Scan a single frequency band.
+        
+        Args:
+            params: Pre-extracted band tuple from _active_bands
+        """
+        (start_freq, end_freq, step_size, gain, dwell_s,
+         threshold_db, band_id, band_name) = params
+        
+        # Settling is done by discarding the first dwell_time worth of samples from the
+        # read instead of sleeping: the USB transfer runs during the dwell and any
+        # samples buffered before the retune are flushed. Rounded up to 256 samples
+        # (512 bytes) so reads stay whole USB blocks.
+        discard: int = int(dwell_s * self.sample_rate_hz)
+        discard = -(-discard // 256) * 256
+        
+        # Set gain for this band (0 = auto)
+        self.driver.set_gain(gain)
+        
+        # Sweep the band in wideband segments: each capture covers the usable part
+        # of the sample rate and every step_size channel inside it is checked from a
+        # single FFT, instead of retuning once per channel.
+        # Analysis of segment N runs on the worker while segment N+1 is tuned and read;
+        # at most one analysis is in flight so the spectrum buffers are never shared
+        segment_width: float = self.sample_rate_hz * self.segment_usable_fraction
+        pending: Optional[Future] = None
+        current_freq: float = start_freq + segment_width / 2
+        while current_freq - segment_width / 2 <= end_freq and self.scan_paused.is_set():
+            # Tune to segment center
             if not self.driver.tune(current_freq):
                 print(f"Failed to tune to {current_freq} Hz")
-                current_freq += step_size
+                current_freq += segment_width
                 continue
             
-            # Brief settling time after tuning
-            time.sleep(dwell_time_ms / 1000.0)
-            
-            # Read samples
-            samples: Optional[np.ndarray] = self.driver.read_samples(self.num_samples)
+            # Read samples; the driver drops the settling prefix before conversion
+            samples: Optional[np.ndarray] = self.driver.read_samples(self.num_samples, discard=discard)
             if samples is None:
                 print(f"Failed to read samples at {current_freq} Hz")
-                current_freq += step_size
+                current_freq += segment_width
                 continue
             
-            # Perform signal analysis
-            self._analyze_samples(samples, current_freq, threshold_db, band)
+            # Perform signal analysis (overlapped with the next read)
+            if pending is not None:
+                pending.result()
+            pending = self._analysis_executor.submit(
+                self._analyze_samples, samples, current_freq, threshold_db,
+                start_freq, end_freq, step_size, band_id, band_name
+            )
             
-            # Move to next frequency
-            current_freq += step_size
+            # Move to next segment
+            current_freq += segment_width
+        
+        if pending is not None:
+            pending.result()
+    
+    def _median(self, values: np.ndarray) -> float:
+        """
+        Median of a float32 array without allocating.
+        
+        Partitions a copy in the scratch buffer instead of np.median's temporary.
+        
+        Args:
+            values: Array of the current FFT size
+        
+        Returns:
+            Median value
+        """
+        n: int = len(values)
+        half: int = n // 2
+        scratch: np.ndarray = self._abs2_buf
+        np.copyto(scratch, values)
+        scratch.partition((half - 1, half))
+        return float(scratch[half]) if n % 2 else float(scratch[half - 1] + scratch[half]) / 2
+    
+    def _build_fft_plan(self, n: int) -> None:
+        """
+        Plan an in-place complex64 FFTW transform of length n.
+        
+        Planning with FFTW_MEASURE is slow, so it happens once per FFT size
+        rather than per segment. No-op when pyfftw is not installed.
+        
+        Args:
+            n: FFT length
+        """
+        if not PYFFTW_AVAILABLE:
+            return
+        
+        self._fft_in = pyfftw.empty_aligned(n, dtype='complex64')
+        self._fft_plan = pyfftw.FFTW(
+            self._fft_in,
+            self._fft_in,
+            direction='FFTW_FORWARD',
+            flags=('FFTW_MEASURE',),
+            threads=1
+        )
+    
+    def _build_relative_freqs(self, n: int) -> np.ndarray:
+        """
+        Build the DC-centred FFT bin offsets from the tuned frequency.
+        
+        Args:
+            n: FFT size
+        
+        Returns:
+            Array of n bin offsets in Hz
+        """
+        return np.arange(-n // 2, n // 2) * (self.sample_rate_hz / n)
     
     def _analyze_samples(
         self,
         samples: np.ndarray,
         center_freq: float,
         threshold_db: float,
-        band: Dict[str, Any]
+        band_start_hz: float,
+        band_end_hz: float,
+        step_size_hz: float,
+        band_id: str,
+        band_name: str
     ) -> None:
         """
         Analyze IQ samples using FFT and detect signals above threshold.
@@ -346,48 +575,119 @@ class Scanner(threading.Thread):
             samples: Complex IQ samples from the SDR
             center_freq: Center frequency of the samples
             threshold_db: Detection threshold in dB above noise floor
-            band: Band configuration dictionary
+            band_start_hz: Lower edge of the band
+            band_end_hz: Upper edge of the band
+            step_size_hz: Channel spacing (minimum distance between detections)
+            band_id: Band identifier (keys the noise floor average with center_freq)
+            band_name: Band name reported in detection events
         """
         try:
-            # Perform FFT on the samples
-            fft_result: np.ndarray = np.fft.fft(samples)
-            
-            # Shift zero frequency to center
-            fft_shifted: np.ndarray = np.fft.fftshift(fft_result)
+            # Single-precision FFT: planned in-place FFTW if available, otherwise
+            # pocketfft (which keeps complex64, where numpy would upcast)
+            n: int = len(samples)
+            half_n: int = n // 2
+            fft_result: np.ndarray
+            if PYFFTW_AVAILABLE:
+                if self._fft_in is None or self._fft_in.shape[0] != n:
+                    self._build_fft_plan(n)
+                np.copyto(self._fft_in, samples, casting='unsafe')
+                self._fft_plan()
+                fft_result = self._fft_in
+            else:
+                samples = np.asarray(samples, dtype=np.complex64)
+                fft_result = sfft.fft(samples, workers=1, overwrite_x=True)
             
-            # Calculate power spectrum in dB
+            # Calculate power spectrum in dB, DC-centred, in the preallocated buffers
             # Add small epsilon to avoid log(0)
-            power_spectrum: np.ndarray = 10 * np.log10(
-                np.abs(fft_shifted) ** 2 + 1e-10
-            )
+            if self._power_buf.shape[0] != n:
+                self._abs2_buf = np.empty(n, dtype=np.float32)
+                self._power_buf = np.empty(n, dtype=np.float32)
+            power_spectrum: np.ndarray = self._power_buf
+            if NUMBA_AVAILABLE:
+                _power_db_shifted(fft_result, power_spectrum)
+            else:
+                # |X|^2 as re*re + im*im on a float32 view (no sqrt);
+                # power_spectrum doubles as scratch before the log10 stores
+                re_im: np.ndarray = fft_result.view(np.float32).reshape(-1, 2)
+                np.multiply(re_im[:, 0], re_im[:, 0], out=self._abs2_buf)
+                np.multiply(re_im[:, 1], re_im[:, 1], out=power_spectrum)
+                np.add(self._abs2_buf, power_spectrum, out=self._abs2_buf)
+                np.add(self._abs2_buf, 1e-10, out=self._abs2_buf)
+                # fftshift folded into the log10 stores: swap halves by slicing
+                np.log10(self._abs2_buf[:n - half_n], out=power_spectrum[half_n:])
+                np.log10(self._abs2_buf[n - half_n:], out=power_spectrum[:half_n])
+                power_spectrum *= 10
             
-            # Send spectrum data for visualization (only if queue is empty to prevent lag)
-            if self.raw_data_queue is not None and self.raw_data_queue.empty():
-                # Calculate frequency bins for the spectrum
-                freq_bin_width: float = self.sample_rate_hz / len(samples)
-                frequencies: np.ndarray = center_freq + np.arange(
-                    -len(samples) // 2, len(samples) // 2
-                ) * freq_bin_width
+            # Send spectrum data for visualization every Nth segment
+            # (and only if the UI has taken the previous one, to prevent lag)
+            self._spectrum_counter += 1
+            if (self._spectrum_counter % self._spectrum_update_interval == 0
+                    and self.raw_data_slot is None):
+                # Frequency bins for the spectrum: cached offsets rebased on this segment
+                # (a fresh array, since the UI thread keeps a reference to it)
+                if self._rel_freqs.shape[0] != n:
+                    self._rel_freqs = self._build_relative_freqs(n)
+                frequencies: np.ndarray = self._rel_freqs + center_freq
                 
-                # Put spectrum data into queue (non-blocking)
-                try:
-                    self.raw_data_queue.put_nowait((frequencies, power_spectrum))
-                except:
-                    pass  # Queue full, skip this update
+                # Publish spectrum data; quantizing also copies out of the reused buffer
+                self.raw_data_slot = self._spectrum_payload(frequencies, power_spectrum)
             
-            # Calculate noise floor as median of power spectrum
-            noise_floor: float = float(np.median(power_spectrum))
+            # Detection spectrum: power averaged over 1/8 of a channel. Single bins
+            # fluctuate by several dB on pure noise, which would otherwise trip the
+            # threshold across thousands of bins. Averaging is done on linear power
+            # so a narrow carrier keeps its energy instead of being flattened in dB.
+            freq_bin_width: float = self.sample_rate_hz / n
+            step_bins: int = max(1, int(step_size_hz / freq_bin_width))
+            smooth_bins: int = max(1, step_bins // 8)
+            linear: np.ndarray = self._abs2_buf
+            np.multiply(power_spectrum, np.float32(0.1 * math.log(10.0)), out=linear)
+            np.exp(linear, out=linear)
+            detect_spectrum: np.ndarray = np.convolve(
+                linear, np.full(smooth_bins, 1.0 / smooth_bins, dtype=np.float32), mode='same'
+            )
+            np.log10(detect_spectrum, out=detect_spectrum)
+            detect_spectrum *= 10
             
-            # Find peak power
-            peak_power: float = float(np.max(power_spectrum))
-            peak_index: int = int(np.argmax(power_spectrum))
+            # Noise floor per bin from a running average of previous sweeps of this
+            # segment (same band, same center); its first capture's median seeds it
+            ema_key: Tuple[str, int] = (band_id, int(round(center_freq)))
+            noise_ema: Optional[np.ndarray] = self._noise_ema.get(ema_key)
+            if noise_ema is None or noise_ema.shape != detect_spectrum.shape:
+                noise_ema = np.full_like(detect_spectrum, self._median(detect_spectrum))
+                self._noise_ema[ema_key] = noise_ema
             
-            # Check if peak exceeds threshold
-            if peak_power > (noise_floor + threshold_db):
+            # Restrict detection to the usable part of the capture that lies inside the band
+            half_width: float = self.sample_rate_hz * self.segment_usable_fraction / 2
+            low_freq: float = max(center_freq - half_width, band_start_hz)
+            high_freq: float = min(center_freq + half_width, band_end_hz)
+            low_bin: int = max(0, int(np.ceil((low_freq - center_freq) / freq_bin_width)) + half_n)
+            high_bin: int = min(n, int(np.floor((high_freq - center_freq) / freq_bin_width)) + half_n + 1)
+            
+            # Vectorized peak search: local maxima above noise + threshold,
+            # at most one per step_size channel
+            if high_bin > low_bin:
+                peaks, _ = find_peaks(
+                    detect_spectrum[low_bin:high_bin],
+                    height=noise_ema[low_bin:high_bin] + threshold_db,
+                    distance=step_bins
+                )
+            else:
+                peaks = np.empty(0, dtype=np.intp)
+            
+            # One timestamp per capture: every peak in it was seen at the same time,
+            # so the clock read and ISO formatting happen once, not per event
+            if len(peaks) > 0:
+                timestamp_ns: int = time.time_ns()
+                timestamp: str = datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+            
+            for peak in peaks:
+                peak_index: int = low_bin + int(peak)
+                peak_power: float = float(detect_spectrum[peak_index])
+                noise_floor: float = float(noise_ema[peak_index])
+                
                 # Calculate the actual frequency of the peak
                 # FFT bins are spread across the sample rate
-                freq_bin_width: float = self.sample_rate_hz / len(samples)
-                offset_from_center: float = (peak_index - len(samples) // 2) * freq_bin_width
+                offset_from_center: float = (peak_index - half_n) * freq_bin_width
                 peak_freq: float = center_freq + offset_from_center
                 
                 # Calculate relative power above noise floor
@@ -395,21 +695,28 @@ class Scanner(threading.Thread):
                 
                 # Create detection event
                 event: Dict[str, Any] = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
+                    "timestamp_ns": timestamp_ns,
                     "frequency_hz": peak_freq,
                     "center_freq_hz": center_freq,
                     "power_db": peak_power,
                     "noise_floor_db": noise_floor,
                     "relative_power_db": relative_power,
-                    "band_id": band.get("id", "unknown"),
-                    "band_name": band.get("name", "Unknown Band")
+                    "band_id": band_id,
+                    "band_name": band_name
                 }
                 
-                # Send event to UI via queue
-                self.result_queue.put(event)
+                # Send event to UI (deque.append is atomic, no lock needed)
+                self.result_queue.append(event)
                 
                 print(f"Signal detected: {peak_freq/1e6:.4f} MHz, "
                       f"Power: {relative_power:.1f} dB above noise")
+            
+            # Fold this spectrum into the running average (in place)
+            scratch: np.ndarray = self._abs2_buf
+            np.multiply(detect_spectrum, self._noise_ema_alpha, out=scratch)
+            noise_ema *= 1.0 - self._noise_ema_alpha
+            noise_ema += scratch
         
         except Exception as e:
             print(f"Error analyzing samples: {e}")
@@ -500,6 +807,24 @@ class Scanner(threading.Thread):
         
         print(f"Spectrum display {'enabled' if enabled else 'disabled'}")
     
+    def take_spectrum(self) -> Optional[SpectrumPayload]:
+        """
+        Take the latest spectrum from raw_data_slot, leaving the slot empty.
+        
+        Emptying the slot is what lets the scanner publish the next spectrum;
+        frames produced while the UI is busy are never queued, only the most
+        recent one is kept.
+        
+        Returns:
+            (frequencies, power, bounds) with power as int16 in
+            1/SPECTRUM_DB_SCALE dB and bounds as (f_min_hz, f_max_hz, p_min_db,
+            p_max_db), or None if no new spectrum is available
+        """
+        spectrum = self.raw_data_slot
+        if spectrum is not None:
+            self.raw_data_slot = None
+        return spectrum
+    
     def get_current_gain(self) -> float:
         """
         Get the current gain setting.
@@ -636,8 +961,27 @@ class Scanner(threading.Thread):
         
         print("Pausing scanner...")
         self.scan_paused.clear()  # Pause scanning
-        time.sleep(0.2)  # Brief delay to allow current operation to complete
-        print("Scanner paused")
+        if self._wait_until_idle():
+            print("Scanner paused")
+        else:
+            print("Scanner did not pause in time; an SDR read may still be in flight")
+    
+    def _wait_until_idle(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for the scanner thread to finish its in-flight segment and park.
+        
+        Callers that tune, reconfigure or disconnect the SDR after pausing rely
+        on this, since read_samples() and tune() take no lock on the scan path.
+        
+        Args:
+            timeout: Maximum wait in seconds
+        
+        Returns:
+            True if the scanner thread is idle (or not running), False on timeout
+        """
+        if not self.is_alive() or threading.current_thread() is self:
+            return True
+        return self._scan_idle.wait(timeout)
     
     def shutdown(self) -> None:
         """
@@ -654,7 +998,11 @@ class Scanner(threading.Thread):
         
         # Pause scanning first
         self.scan_paused.clear()
-        time.sleep(0.3)  # Allow current operations to complete
+        if not self._wait_until_idle():
+            print("Scanner did not pause in time; an SDR read may still be in flight")
+        
+        # Stop the analysis worker (waits for an in-flight FFT)
+        self._analysis_executor.shutdown(wait=True)
         
         # Close audio stream
         if self.audio_stream is not None:
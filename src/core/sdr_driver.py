@@ -22,6 +22,15 @@ class SdrDriver:
     This class encapsulates all hardware interactions with RTL-SDR devices,
     providing error handling and a clean interface for the scanning application.
     Designed to support multi-SDR configurations through device_index parameter.
+    
+    Threading: while Scanner.run() is active the scanner thread owns the device.
+    read_samples() and tune() are its hot path and take no lock. That is safe
+    because no other thread calls them (or disconnect()) while a scan is running:
+    the UI hands manual frequency changes to the scanner, and tunes or disconnects
+    only after Scanner.stop_scan() has returned, which waits for the in-flight
+    segment to finish. The rare configuration mutators (set_gain,
+    set_sample_rate, set_ppm_correction), which the UI may still call, serialize
+    on a reentrant device lock.
     """
     
     def __init__(self, device_index: int = 0) -> None:
@@ -35,7 +44,7 @@ class SdrDriver:
         self.sdr: Optional[RtlSdr] = None
         self.is_connected: bool = False
         self.ppm_error: int = 0  # Frequency correction in PPM
-        self._device_lock: threading.Lock = threading.Lock()  # Thread-safe device access
+        self._device_lock: threading.RLock = threading.RLock()  # Serializes configuration mutators only
     
     def connect(self) -> bool:
         """
@@ -75,6 +84,8 @@ class SdrDriver:
         """
         Tune the SDR to a specific frequency.
         
+        Unlocked scanner-thread fast path (see the class docstring).
+        
         Args:
             freq_hz: Target frequency in Hz
             
@@ -85,13 +96,12 @@ class SdrDriver:
             print("Cannot tune: SDR not connected")
             return False
         
-        with self._device_lock:
-            try:
-                self.sdr.center_freq = freq_hz
-                return True
-            except Exception as e:
-                print(f"Failed to tune to {freq_hz} Hz: {e}")
-                return False
+        try:
+            self.sdr.center_freq = freq_hz
+            return True
+        except Exception as e:
+            print(f"Failed to tune to {freq_hz} Hz: {e}")
+            return False
     
     def set_gain(self, gain: float) -> bool:
         """
@@ -119,27 +129,49 @@ class SdrDriver:
                 print(f"Failed to set gain to {gain} dB: {e}")
                 return False
     
-    def read_samples(self, num_samples: int) -> Optional[np.ndarray]:
+    def read_samples(self, num_samples: int, dtype: type = np.complex64, discard: int = 0) -> Optional[np.ndarray]:
         """
         Read IQ samples from the SDR.
         
+        Only the scanner thread reads samples, so this hot path does not take
+        the device lock (nor does tune(); see the class docstring). Gain,
+        sample rate and PPM changes, which may come from the UI thread, do.
+        
+        By default the raw uint8 USB bytes are read and converted to complex64
+        here in one vectorized pass, instead of going through pyrtlsdr's
+        complex128 conversion. Pass dtype=np.complex128 for the legacy
+        pyrtlsdr read_samples() path.
+        
+        The first `discard` samples are read in the same USB transfer (for
+        settling after a retune) but dropped as raw bytes, before conversion.
+        
         Args:
             num_samples: Number of samples to read
+            dtype: np.complex64 (default) or np.complex128 (legacy pyrtlsdr path)
+            discard: Leading samples to read and drop (default: 0)
             
         Returns:
             NumPy array of complex IQ samples, or None if read fails
         """
-        if not self.is_connected or self.sdr is None:
+        sdr = self.sdr
+        if not self.is_connected or sdr is None:
             print("Cannot read samples: SDR not connected")
             return None
         
-        with self._device_lock:
-            try:
-                samples = self.sdr.read_samples(num_samples)
-                return samples
-            except Exception as e:
-                print(f"Failed to read {num_samples} samples: {e}")
-                return None
+        try:
+            if dtype == np.complex128:
+                return sdr.read_samples(discard + num_samples)[discard:]
+            
+            # Interleaved uint8 I/Q -> float32 in [-1, 1], viewed as complex64;
+            # the discarded prefix is skipped in the byte buffer, not converted
+            raw = sdr.read_bytes(2 * (discard + num_samples))
+            iq = np.frombuffer(raw, dtype=np.uint8, offset=2 * discard).astype(np.float32)
+            iq -= 127.5
+            iq *= 1.0 / 127.5
+            return iq.view(np.complex64)
+        except Exception as e:
+            print(f"Failed to read {num_samples} samples: {e}")
+            return None
     
     def set_sample_rate(self, rate_hz: float) -> bool:
         """
@@ -5,11 +5,82 @@ This module implements database logging functionality for detected signal events
 All detection events are stored in a SQLite database for later analysis.
 """
 
+import logging
+import math
 import sqlite3
 import threading
-from typing import Dict, Any, Optional
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from queue import Queue, Empty, Full
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 import os
 
+# Optional columnar sink for analytics (see SignalLogger arrow_path)
+PYARROW_AVAILABLE = False
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+
+
+log = logging.getLogger(__name__)
+
+# Power is stored as integer centi-dB (power_db * POWER_SCALE) and frequency as
+# integer Hz: SQLite stores small integers in 1-4 bytes instead of an 8-byte REAL
+POWER_SCALE = 100
+
+# Busy timeouts: writers wait out each other's transactions, while readers (the
+# UI thread) give up sooner and let the caller retry instead of freezing
+WRITE_BUSY_TIMEOUT_S = 10.0
+READ_BUSY_TIMEOUT_S = 2.0
+
+# Band names, stored once and referenced from detections by a small integer id
+BANDS_SQL = """
+    CREATE TABLE IF NOT EXISTS bands (
+        id INTEGER PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL
+    )
+"""
+
+# Detections table, shared by initialization, migration and clearing
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS detections (
+        id INTEGER PRIMARY KEY,
+        timestamp_ns INTEGER NOT NULL,
+        frequency_hz INTEGER NOT NULL,
+        power_cdb INTEGER NOT NULL,
+        band_id INTEGER NOT NULL REFERENCES bands (id)
+    )
+"""
+
+# Insert statement shared by the batch writer and bulk logging (served from the
+# per-connection statement cache)
+INSERT_SQL = """
+    INSERT INTO detections (timestamp_ns, frequency_hz, power_cdb, band_id)
+    VALUES (?, CAST(ROUND(?) AS INTEGER), CAST(ROUND(? * 100) AS INTEGER), ?)
+"""
+
+# Batch insert into the in-memory shadow table (see shadow_flush_interval_s)
+INSERT_SHADOW_SQL = """
+    INSERT INTO mem.detections (timestamp_ns, frequency_hz, power_cdb, band_id)
+    VALUES (?, CAST(ROUND(?) AS INTEGER), CAST(ROUND(? * 100) AS INTEGER), ?)
+"""
+
+
+class _ClearRequest:
+    """
+    Writer-queue item asking the writer thread to clear all detections.
+    
+    Handled in queue order, so rows queued before it are discarded with the
+    table instead of reappearing after the clear.
+    """
+    
+    def __init__(self) -> None:
+        self.done: threading.Event = threading.Event()
+        self.ok: bool = False
+
 
 class SignalLogger:
     """
@@ -19,131 +90,686 @@ class SignalLogger:
     detected signals with timestamp, frequency, power level, and band information.
     """
     
-    def __init__(self, db_path: str = "scan_results.db") -> None:
+    def __init__(
+        self,
+        db_path: str = "scan_results.db",
+        shadow_flush_interval_s: Optional[float] = None,
+        cache_mib: int = 64,
+        mmap_mib: int = 1024,
+        arrow_path: Optional[str] = None
+    ) -> None:
         """
         Initialize the signal logger and create database schema.
         
         Args:
             db_path: Path to the SQLite database file (default: scan_results.db)
+            shadow_flush_interval_s: If set, batches go to an in-memory shadow
+                table that is copied to disk every this many seconds, for very
+                high event rates. Up to that much data is lost on a crash, and
+                queries only see rows once flushed. (default: None, write-through)
+            cache_mib: SQLite page cache per connection in MiB (default: 64)
+            mmap_mib: Memory-mapped I/O window in MiB, 0 disables (default: 1024)
+            arrow_path: If set (and pyarrow is installed), logged events are also
+                appended to this Arrow IPC stream file in columnar form for
+                analytics. The file is overwritten per session and restarted
+                empty by clear_all_detections(). (default: None)
         """
         self.db_path: str = db_path
-        self._lock: threading.Lock = threading.Lock()
+        self._cache_mib: int = cache_mib
+        self._mmap_mib: int = mmap_mib
+        # Serializes writers only; readers rely on WAL snapshots and never wait on it
+        self._write_lock: threading.Lock = threading.Lock()
+        self._tls: threading.local = threading.local()  # One open connection per thread
+        
+        # Batched writes: log_event only queues rows, the writer thread commits up to
+        # _batch_size rows (or whatever arrived within _flush_interval_s) per transaction
+        self._queue: Queue = Queue(maxsize=10000)
+        self._batch_size: int = 256
+        self._flush_interval_s: float = 0.5
+        
+        # Row count maintained by the writers (counted once at startup), so
+        # get_detection_count() never scans the table
+        self._count: int = 0
+        
+        # Band name -> bands.id, filled on first use by the writers
+        self._band_ids: Dict[str, int] = {}
+        
+        # Optional in-memory shadow table (attached as "mem" on the writer's connection)
+        self._shadow_interval_s: Optional[float] = shadow_flush_interval_s
+        self._shadow_rows: int = 0  # Rows waiting in mem.detections
+        self._shadow_flushed_at: float = time.monotonic()
+        
+        # Optional Arrow IPC sink, written by the writer thread alongside SQLite
+        self._arrow_path: Optional[str] = arrow_path
+        self._arrow_sink = None
+        self._arrow_writer = None
+        self._arrow_schema = None
+        if arrow_path is not None:
+            self._open_arrow_sink(arrow_path)
         
         # Create the database and table if they don't exist
         self._initialize_database()
+        
+        self._writer: threading.Thread = threading.Thread(
+            target=self._drain, name="signal-logger", daemon=True
+        )
+        self._writer.start()
+    
+    def _connect(self, busy_timeout_s: float = WRITE_BUSY_TIMEOUT_S) -> sqlite3.Connection:
+        """
+        Open a database connection with the per-connection PRAGMAs applied.
+        
+        Connections run in autocommit mode (isolation_level=None): each
+        statement commits on its own unless a transaction is opened explicitly.
+        
+        Args:
+            busy_timeout_s: Seconds to wait on a locked database before failing
+                with "database is locked" (default: WRITE_BUSY_TIMEOUT_S)
+        
+        Returns:
+            New sqlite3 connection
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            timeout=busy_timeout_s,
+            isolation_level=None,
+            cached_statements=128
+        )
+        conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_s * 1000)}")
+        # One fsync per WAL commit instead of two; still safe against app crashes
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA mmap_size={self._mmap_mib * 1024 * 1024}")
+        conn.execute(f"PRAGMA cache_size={-self._cache_mib * 1024}")  # Negative = KiB
+        return conn
+    
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """
+        Rebuild a detections table from an older layout into the current one.
+        
+        Older databases stored ISO 8601 TEXT timestamps, REAL frequency and
+        power, and/or the band name on every row. They are rebuilt once: band
+        names are interned into the bands table and rows are copied into the
+        new layout (timestamps parsed, frequency rounded to Hz, power to
+        centi-dB), then the old table is dropped.
+        
+        Args:
+            conn: Open connection used for schema setup
+        """
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(detections)")]
+        if "band_id" in columns:
+            return
+        
+        text_timestamps = "timestamp" in columns
+        ts_column = "timestamp" if text_timestamps else "timestamp_ns"
+        power_scale = 1 if "power_cdb" in columns else POWER_SCALE
+        power_column = "power_cdb" if "power_cdb" in columns else "power_db"
+        
+        log.info("Migrating detections table to the integer schema")
+        with self._transaction(conn):
+            conn.execute("ALTER TABLE detections RENAME TO detections_old")
+            conn.execute(SCHEMA_SQL)
+            conn.execute("""
+                INSERT OR IGNORE INTO bands (name)
+                SELECT DISTINCT band_name FROM detections_old
+            """)
+            old_rows = conn.execute(f"""
+                SELECT d.id, d.{ts_column}, d.frequency_hz, d.{power_column}, b.id
+                FROM detections_old d JOIN bands b ON b.name = d.band_name
+            """)
+            conn.executemany("""
+                INSERT INTO detections (id, timestamp_ns, frequency_hz, power_cdb, band_id)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                (
+                    row_id,
+                    int(datetime.fromisoformat(ts).timestamp() * 1e9) if text_timestamps else ts,
+                    int(round(freq)),
+                    int(round(power * power_scale)),
+                    band_id
+                )
+                for row_id, ts, freq, power, band_id in old_rows
+            ))
+            conn.execute("DROP TABLE detections_old")
+    
+    def _intern_band(self, conn: sqlite3.Connection, name: str) -> int:
+        """
+        Get the bands table id for a band name, adding the name if it is new.
+        
+        Args:
+            conn: Writer connection (normally inside the batch's transaction)
+            name: Band name
+        
+        Returns:
+            Band id
+        """
+        band_id = self._band_ids.get(name)
+        if band_id is None:
+            conn.execute("INSERT OR IGNORE INTO bands (name) VALUES (?)", (name,))
+            band_id = conn.execute("SELECT id FROM bands WHERE name = ?", (name,)).fetchone()[0]
+            self._band_ids[name] = band_id
+        return band_id
+    
+    def _with_band_ids(
+        self,
+        conn: sqlite3.Connection,
+        rows: Iterable[Tuple[int, float, float, str]]
+    ) -> Iterator[Tuple[int, float, float, int]]:
+        """
+        Replace the band name in each row with its bands table id.
+        
+        Args:
+            conn: Writer connection, used to intern names not cached yet
+            rows: (timestamp_ns, frequency_hz, power_db, band_name) tuples
+        
+        Yields:
+            (timestamp_ns, frequency_hz, power_db, band_id) tuples
+        """
+        band_ids = self._band_ids
+        for timestamp_ns, frequency_hz, power_db, band_name in rows:
+            band_id = band_ids.get(band_name)
+            if band_id is None:
+                band_id = self._intern_band(conn, band_name)
+            yield (timestamp_ns, frequency_hz, power_db, band_id)
+    
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection, immediate: bool = True) -> Iterator[None]:
+        """
+        Run a block as one explicit transaction on an autocommit connection.
+        
+        Commits on success and rolls back if the block raises. IMMEDIATE takes
+        the write lock up front, so a writer never fails to upgrade mid-batch.
+        
+        Args:
+            conn: Connection opened by _connect (isolation_level=None)
+            immediate: BEGIN IMMEDIATE (default) instead of a deferred BEGIN
+        """
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection, opening it on first use.
+        
+        The connection stays open for the life of the thread, so logging and
+        queries don't pay for a connect/close and PRAGMA setup on every call.
+        
+        Returns:
+            Thread-local sqlite3 connection
+        """
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._tls.conn = conn
+        return conn
+    
+    def _read_conn(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's query connection, opening it on first use.
+        
+        Separate from _conn() so queries use the shorter READ_BUSY_TIMEOUT_S.
+        
+        Returns:
+            Thread-local sqlite3 connection for reads
+        """
+        conn = getattr(self._tls, "read_conn", None)
+        if conn is None:
+            conn = self._connect(READ_BUSY_TIMEOUT_S)
+            self._tls.read_conn = conn
+        return conn
     
     def _initialize_database(self) -> None:
         """
         Create the detections table if it doesn't exist.
         
         Schema:
-            - id: Auto-incrementing primary key
-            - timestamp: Detection timestamp (ISO 8601 format)
-            - frequency_hz: Detected frequency in Hz
-            - power_db: Signal power in dB
-            - band_name: Name of the band where signal was detected
+            - id: Rowid primary key (no AUTOINCREMENT; still increasing, so
+              ORDER BY id DESC returns the newest rows)
+            - timestamp_ns: Detection time in integer nanoseconds since the epoch
+            - frequency_hz: Detected frequency in integer Hz
+            - power_cdb: Signal power in integer hundredths of a dB
+            - band_id: Band where the signal was detected (bands.id)
+        
+        Band names live in the bands table (id, name), one row per band.
         """
         try:
-            conn = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False,
-                timeout=10.0
-            )
+            conn = self._connect()
             cursor = conn.cursor()
             
-            # Create detections table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS detections (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    frequency_hz REAL NOT NULL,
-                    power_db REAL NOT NULL,
-                    band_name TEXT NOT NULL
-                )
-            """)
+            # WAL: commits append to the -wal file with one fsync, and readers no
+            # longer block the writer. The mode is stored in the database file, so
+            # setting it once here covers later connections (not for :memory:).
+            if self.db_path != ":memory:":
+                cursor.execute("PRAGMA journal_mode=WAL")
+                mode = cursor.fetchone()[0]
+                if str(mode).lower() != "wal":
+                    log.warning("WAL journal mode not enabled (journal_mode=%s)", mode)
             
-            # Create indexes for common queries
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_timestamp 
-                ON detections(timestamp)
-            """)
+            # Create bands and detections tables
+            cursor.execute(BANDS_SQL)
+            cursor.execute(SCHEMA_SQL)
             
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_frequency 
-                ON detections(frequency_hz)
-            """)
+            self._migrate_schema(conn)
             
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_band 
-                ON detections(band_name)
-            """)
+            # No secondary indexes: nothing here queries by timestamp, frequency or
+            # band, and each index costs an extra B-tree write per insert. Drop the
+            # ones older databases were created with.
+            cursor.execute("DROP INDEX IF EXISTS idx_timestamp")
+            cursor.execute("DROP INDEX IF EXISTS idx_frequency")
+            cursor.execute("DROP INDEX IF EXISTS idx_band")
+            
+            # Startup row count (also faults the table's pages into the OS cache)
+            self._count = cursor.execute("SELECT COUNT(*) FROM detections").fetchone()[0]
             
-            conn.commit()
+            # The schema is created on its own connection, closed before any
+            # thread opens its thread-local one
             conn.close()
             
-            print(f"Database initialized: {self.db_path}")
+            log.info("Database initialized: %s", self.db_path)
         
-        except sqlite3.Error as e:
-            print(f"Database initialization error: {e}")
+        except (sqlite3.Error, ValueError) as e:
+            log.error("Database initialization error: %s", e)
     
     def log_event(self, event_dict: Dict[str, Any]) -> bool:
         """
-        Log a detection event to the database.
+        Queue a detection event for the background writer.
         
         Args:
             event_dict: Dictionary containing event data with keys:
-                - timestamp: ISO format timestamp string
+                - timestamp_ns: Integer nanoseconds since the epoch, or
+                - timestamp: ISO format timestamp string (parsed when timestamp_ns is absent)
                 - frequency_hz: Detected frequency in Hz
                 - relative_power_db or power_db: Signal power
                 - band_name: Name of the band
         
         Returns:
-            True if logging successful, False otherwise
+            True if the event was queued, False if invalid or the queue is full
         """
         try:
-            # Extract required fields
-            timestamp: str = event_dict.get("timestamp", "")
-            frequency_hz: float = event_dict.get("frequency_hz", 0.0)
-            
-            # Try both field names for power
-            power_db: float = event_dict.get(
-                "relative_power_db",
-                event_dict.get("power_db", 0.0)
-            )
+            row = self._event_row(event_dict)
+            if row is None:
+                log.warning(
+                    "Invalid event data, skipping log entry: ts=%r freq=%r",
+                    event_dict.get("timestamp"), event_dict.get("frequency_hz")
+                )
+                return False
             
-            band_name: str = event_dict.get("band_name", "Unknown")
+            # Hand off to the writer thread (never blocks the scanner)
+            self._queue.put_nowait(row)
+            return True
+        
+        except Full:
+            log.warning("Logger queue full, dropping event")
+            return False
+        
+        except Exception as e:
+            log.exception("Unexpected error logging event")
+            return False
+    
+    def log_events(self, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert many detection events at once, bypassing the writer queue.
+        
+        Rows are extracted lazily by a generator fed straight to executemany,
+        so no intermediate list of tuples is built, and everything is written
+        in one transaction. Intended for bulk imports; the scan path uses log_event.
+        
+        Args:
+            events: Event dictionaries (same keys as log_event), any iterable
+        
+        Returns:
+            Number of rows written (invalid events are skipped)
+        """
+        event_row = self._event_row
+        rows = (row for row in map(event_row, events) if row is not None)
+        return self._write_rows(rows)
+    
+    @staticmethod
+    def _event_row(event_dict: Dict[str, Any]) -> Optional[Tuple[int, float, float, str]]:
+        """
+        Extract the database row from an event dictionary.
+        
+        Args:
+            event_dict: Event dictionary (see log_event)
+        
+        Returns:
+            (timestamp_ns, frequency_hz, power_db, band_name), or None if invalid
+        """
+        # Fast path: direct lookups of the keys scanner events always carry, with
+        # the exact types the scanner produces; anything else (None, numpy
+        # scalars, strings) is coerced or rejected by the slow path, so a bad
+        # event cannot reach executemany and roll back the whole batch
+        try:
+            timestamp_ns: int = event_dict["timestamp_ns"]
+            frequency_hz: float = event_dict["frequency_hz"]
+            power_db: float = event_dict["relative_power_db"]
+            band_name: str = event_dict["band_name"]
+        except KeyError:
+            return SignalLogger._event_row_slow(event_dict)
+        
+        if (type(timestamp_ns) is not int or type(frequency_hz) is not float
+                or type(power_db) is not float or type(band_name) is not str):
+            return SignalLogger._event_row_slow(event_dict)
+        
+        # NaN would be stored as NULL and violate NOT NULL
+        if not frequency_hz or not math.isfinite(frequency_hz) or not math.isfinite(power_db):
+            return None
+        return (timestamp_ns, frequency_hz, power_db, band_name)
+    
+    @staticmethod
+    def _event_row_slow(event_dict: Dict[str, Any]) -> Optional[Tuple[int, float, float, str]]:
+        """
+        Extract the database row from an event the fast path could not take.
+        
+        Parses an ISO 'timestamp' when 'timestamp_ns' is absent, falls back to
+        'power_db', applies the defaults and coerces the values to the column
+        types. Values that cannot be coerced, or are not finite, reject the event.
+        
+        Args:
+            event_dict: Event dictionary (see log_event)
+        
+        Returns:
+            (timestamp_ns, frequency_hz, power_db, band_name), or None if invalid
+        """
+        timestamp_ns: Optional[int] = event_dict.get("timestamp_ns")
+        if timestamp_ns is None:
+            timestamp: str = event_dict.get("timestamp", "")
+            if not timestamp:
+                return None
+            try:
+                timestamp_ns = int(datetime.fromisoformat(timestamp).timestamp() * 1e9)
+            except (TypeError, ValueError):
+                return None
+        
+        # Try both field names for power
+        power_db: Optional[float] = event_dict.get("relative_power_db")
+        if power_db is None:
+            power_db = event_dict.get("power_db", 0.0)
+        
+        try:
+            timestamp_ns = int(timestamp_ns)
+            frequency_hz: float = float(event_dict.get("frequency_hz") or 0.0)
+            power_db = float(power_db)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if not frequency_hz or not math.isfinite(frequency_hz) or not math.isfinite(power_db):
+            return None
+        
+        band_name = event_dict.get("band_name")
+        return (timestamp_ns, frequency_hz, power_db, "Unknown" if band_name is None else str(band_name))
+    
+    def _drain(self) -> None:
+        """
+        Writer thread: commit queued rows in batches, one transaction per batch.
+        
+        Blocks for the first row, then collects more until the batch is full or
+        the flush interval has passed. A threading.Event in the queue is a
+        flush marker (set once everything queued before it is committed), a
+        _ClearRequest clears the tables, and None stops the thread. In shadow
+        mode batches land in mem.detections and are copied to disk every
+        shadow_flush_interval_s.
+        """
+        if self._shadow_interval_s is not None and not self._attach_shadow():
+            self._shadow_interval_s = None  # Fall back to write-through
+        
+        while True:
+            try:
+                item = self._queue.get(timeout=self._shadow_timeout())
+            except Empty:
+                self._flush_shadow()
+                continue
+            if item is None:
+                self._flush_shadow()
+                return
             
-            # Validate required fields
-            if not timestamp or frequency_hz == 0:
-                print("Warning: Invalid event data, skipping log entry")
-                return False
+            rows: List[Tuple[int, float, float, str]] = []
+            markers: List[threading.Event] = []
+            clear: Optional[_ClearRequest] = None
+            stop = False
+            deadline = time.monotonic() + self._flush_interval_s
             
-            # Thread-safe database write
-            with self._lock:
-                conn = sqlite3.connect(
-                    self.db_path,
-                    check_same_thread=False,
-                    timeout=10.0
-                )
-                cursor = conn.cursor()
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                    break
+                if isinstance(item, _ClearRequest):
+                    clear = item
+                    break
+                rows.append(item)
+                if len(rows) >= self._batch_size:
+                    break
                 
-                cursor.execute("""
-                    INSERT INTO detections (timestamp, frequency_hz, power_db, band_name)
-                    VALUES (?, ?, ?, ?)
-                """, (timestamp, frequency_hz, power_db, band_name))
-                
-                conn.commit()
-                conn.close()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except Empty:
+                    break
             
+            # Rows queued before a clear are discarded, not committed and dropped,
+            # and the Arrow mirror restarts empty with the tables
+            if rows and clear is None:
+                if self._shadow_interval_s is None:
+                    self._write_rows(rows)
+                else:
+                    self._write_shadow(rows)
+                if self._arrow_writer is not None:
+                    self._write_arrow(rows)
+            if clear is not None:
+                clear.ok = self._clear_tables(shadow=self._shadow_interval_s is not None)
+                if clear.ok and self._arrow_writer is not None:
+                    self._close_arrow_sink()
+                    self._open_arrow_sink(self._arrow_path)
+                clear.done.set()
+            elif markers or stop or self._shadow_timeout() == 0.0:
+                self._flush_shadow()
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+    
+    def _open_arrow_sink(self, path: str) -> None:
+        """
+        Open the Arrow IPC stream that mirrors logged events in columnar form.
+        
+        The stream format (not the file format) is used so the data stays
+        readable if the application exits without close(), and so each batch
+        can carry its own band_name dictionary.
+        
+        Args:
+            path: Output file path (overwritten)
+        """
+        if not PYARROW_AVAILABLE:
+            log.warning("pyarrow not installed, Arrow sink disabled: %s", path)
+            return
+        
+        self._arrow_schema = pa.schema([
+            ("timestamp_ns", pa.int64()),
+            ("frequency_hz", pa.float64()),
+            ("power_db", pa.float32()),
+            ("band_name", pa.dictionary(pa.int16(), pa.string())),
+        ])
+        try:
+            self._arrow_sink = pa.OSFile(path, "wb")
+            self._arrow_writer = pa.ipc.new_stream(self._arrow_sink, self._arrow_schema)
+        except (OSError, pa.ArrowException):
+            log.error("Could not open Arrow sink %s", path, exc_info=True)
+            self._arrow_sink = None
+            self._arrow_writer = None
+    
+    def _close_arrow_sink(self) -> None:
+        """
+        Finish the Arrow stream (end-of-stream marker) and close the file.
+        """
+        try:
+            self._arrow_writer.close()
+            self._arrow_sink.close()
+        except (OSError, pa.ArrowException):
+            log.error("Could not close Arrow sink", exc_info=True)
+        self._arrow_sink = None
+        self._arrow_writer = None
+    
+    def _write_arrow(self, rows: List[Tuple[int, float, float, str]]) -> None:
+        """
+        Append a batch to the Arrow sink as one columnar record batch.
+        
+        Args:
+            rows: (timestamp_ns, frequency_hz, power_db, band_name) tuples
+        """
+        timestamps, frequencies, powers, bands = zip(*rows)
+        band_codes = pa.array(bands, pa.string()).dictionary_encode()
+        try:
+            self._arrow_writer.write_batch(pa.record_batch([
+                pa.array(timestamps, pa.int64()),
+                pa.array(frequencies, pa.float64()),
+                pa.array(powers, pa.float32()),
+                pa.DictionaryArray.from_arrays(
+                    band_codes.indices.cast(pa.int16()), band_codes.dictionary
+                ),
+            ], schema=self._arrow_schema))
+        except (OSError, pa.ArrowException):
+            log.error("Arrow sink write error (%d rows skipped)", len(rows), exc_info=True)
+    
+    def _attach_shadow(self) -> bool:
+        """
+        Attach an in-memory database to the writer's connection as "mem".
+        
+        Returns:
+            True if the shadow table is ready, False otherwise
+        """
+        try:
+            conn = self._conn()
+            conn.execute("ATTACH DATABASE ':memory:' AS mem")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS mem.detections AS
+                SELECT timestamp_ns, frequency_hz, power_cdb, band_id
+                FROM main.detections WHERE 0
+            """)
             return True
         
-        except sqlite3.Error as e:
-            print(f"Database write error: {e}")
+        except sqlite3.Error:
+            log.error("Could not attach shadow table, writing through", exc_info=True)
             return False
+    
+    def _shadow_timeout(self) -> Optional[float]:
+        """
+        Seconds until the next shadow flush is due.
         
-        except Exception as e:
-            print(f"Unexpected error logging event: {e}")
+        Returns:
+            None without a shadow table (block indefinitely), else >= 0.0
+        """
+        if self._shadow_interval_s is None:
+            return None
+        due = self._shadow_flushed_at + self._shadow_interval_s
+        return max(0.0, due - time.monotonic())
+    
+    def _write_shadow(self, rows: List[Tuple[int, float, float, str]]) -> None:
+        """
+        Append a batch to the in-memory shadow table.
+        
+        New band names are still interned into main.bands on disk, so the batch
+        runs under the write lock like any other writer.
+        
+        Args:
+            rows: (timestamp_ns, frequency_hz, power_db, band_name) tuples
+        """
+        try:
+            with self._write_lock:
+                conn = self._conn()
+                with self._transaction(conn, immediate=False):
+                    conn.executemany(INSERT_SHADOW_SQL, self._with_band_ids(conn, rows))
+                self._shadow_rows += len(rows)
+        
+        except sqlite3.Error:
+            self._band_ids.clear()  # Bands interned by the rolled-back batch are gone
+            log.error("Shadow write error (%d rows dropped)", len(rows), exc_info=True)
+    
+    def _flush_shadow(self) -> None:
+        """
+        Move everything in the shadow table to disk in one transaction.
+        """
+        self._shadow_flushed_at = time.monotonic()
+        if self._shadow_interval_s is None or self._shadow_rows == 0:
+            return
+        
+        try:
+            with self._write_lock:
+                conn = self._conn()
+                with self._transaction(conn):
+                    conn.execute("""
+                        INSERT INTO main.detections (timestamp_ns, frequency_hz, power_cdb, band_id)
+                        SELECT timestamp_ns, frequency_hz, power_cdb, band_id
+                        FROM mem.detections ORDER BY rowid
+                    """)
+                    conn.execute("DELETE FROM mem.detections")
+                self._count += self._shadow_rows
+                self._shadow_rows = 0
+        
+        except sqlite3.Error:
+            log.error("Shadow flush error (%d rows kept in memory)", self._shadow_rows, exc_info=True)
+    
+    def _write_rows(self, rows: Iterable[Tuple[int, float, float, str]]) -> int:
+        """
+        Insert a batch of rows in a single transaction.
+        
+        Args:
+            rows: (timestamp_ns, frequency_hz, power_db, band_name) tuples,
+                a list or a generator
+        
+        Returns:
+            Number of rows committed (0 on failure)
+        """
+        try:
+            with self._write_lock:
+                conn = self._conn()
+                with self._transaction(conn):
+                    written = conn.executemany(INSERT_SQL, self._with_band_ids(conn, rows)).rowcount
+                self._count += written
+            return written
+        
+        except sqlite3.Error:
+            self._band_ids.clear()  # Bands interned by the rolled-back batch are gone
+            log.error("Database write error (batch dropped)", exc_info=True)
+            return 0
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every event queued so far has been committed.
+        
+        Args:
+            timeout: Maximum seconds to wait (default: no limit)
+        
+        Returns:
+            True if flushed, False on timeout or if the writer has stopped
+        """
+        if not self._writer.is_alive():
             return False
+        
+        marker = threading.Event()
+        self._queue.put(marker)
+        return marker.wait(timeout)
+    
+    def close(self) -> None:
+        """
+        Commit pending events, stop the writer thread and close the Arrow sink.
+        """
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        
+        if self._arrow_writer is not None:
+            self._close_arrow_sink()
     
     def get_recent_detections(self, limit: int = 100) -> list:
         """
@@ -153,87 +779,119 @@ class SignalLogger:
             limit: Maximum number of records to retrieve (default: 100)
         
         Returns:
-            List of tuples (id, timestamp, frequency_hz, power_db, band_name)
+            List of tuples (id, timestamp, frequency_hz, power_db, band_name), with
+            timestamp formatted back to an ISO 8601 string and power back to dB
+        
+        Raises:
+            sqlite3.OperationalError: "database is locked" if the database stayed
+                busy for READ_BUSY_TIMEOUT_S; safe to retry. Other database
+                errors are logged and return an empty list.
         """
         try:
-            with self._lock:
-                conn = sqlite3.connect(
-                    self.db_path,
-                    check_same_thread=False,
-                    timeout=10.0
+            conn = self._read_conn()
+            cursor = conn.cursor()
+            
+            # id is the rowid, so this walks the last leaf pages of the table B-tree
+            # directly (EXPLAIN QUERY PLAN: "SCAN d", no sort step), with one
+            # primary-key lookup into bands per row. A covering index on (id, ...)
+            # would not be chosen and only duplicates every row on insert.
+            cursor.execute("""
+                SELECT d.id, d.timestamp_ns, d.frequency_hz, d.power_cdb, b.name
+                FROM detections d JOIN bands b ON b.id = d.band_id
+                ORDER BY d.id DESC
+                LIMIT ?
+            """, (limit,))
+            
+            results = [
+                (
+                    row_id,
+                    datetime.fromtimestamp(ts_ns / 1e9).isoformat(),
+                    float(freq),
+                    power_cdb / POWER_SCALE,
+                    band
                 )
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT id, timestamp, frequency_hz, power_db, band_name
-                    FROM detections
-                    ORDER BY id DESC
-                    LIMIT ?
-                """, (limit,))
-                
-                results = cursor.fetchall()
-                conn.close()
-                
-                return results
+                for row_id, ts_ns, freq, power_cdb, band in cursor.fetchall()
+            ]
+            
+            return results
+        
+        except sqlite3.OperationalError as e:
+            if "locked" in str(e):
+                raise
+            log.error("Database read error: %s", e)
+            return []
         
         except sqlite3.Error as e:
-            print(f"Database read error: {e}")
+            log.error("Database read error: %s", e)
             return []
     
     def get_detection_count(self) -> int:
         """
         Get the total number of detections in the database.
         
+        Served from a counter kept by this logger's writers; rows written by
+        another process after startup are not included.
+        
         Returns:
-            Total detection count
+            Total committed detection count
         """
-        try:
-            with self._lock:
-                conn = sqlite3.connect(
-                    self.db_path,
-                    check_same_thread=False,
-                    timeout=10.0
-                )
-                cursor = conn.cursor()
-                
-                cursor.execute("SELECT COUNT(*) FROM detections")
-                count = cursor.fetchone()[0]
-                
-                conn.close()
-                
-                return count
-        
-        except sqlite3.Error as e:
-            print(f"Database query error: {e}")
-            return 0
+        return self._count
     
     def clear_all_detections(self) -> bool:
         """
         Clear all detection records from the database.
         
+        Runs on the writer thread, in queue order: rows still queued are
+        discarded and the shadow table is emptied too, so nothing logged
+        before the clear comes back at the next flush or close(). The Arrow
+        sink, if any, is restarted as an empty stream.
+        
         WARNING: This permanently deletes all logged data.
         
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._writer.is_alive():
+            # Closed: nothing queued, and close() already flushed the shadow table
+            return self._clear_tables(shadow=False)
+        
+        request = _ClearRequest()
+        self._queue.put(request)
+        request.done.wait()
+        return request.ok
+    
+    def _clear_tables(self, shadow: bool) -> bool:
+        """
+        Drop and recreate the detections table (and empty the shadow table).
+        
+        Drops and recreates in one transaction rather than DELETE + VACUUM:
+        freed pages go back to SQLite's free list for reuse without
+        rewriting the whole file under an exclusive lock.
+        
+        Args:
+            shadow: True to also empty mem.detections (writer thread only,
+                where it is attached)
+        
         Returns:
             True if successful, False otherwise
         """
         try:
-            with self._lock:
-                conn = sqlite3.connect(
-                    self.db_path,
-                    check_same_thread=False,
-                    timeout=10.0
-                )
-                cursor = conn.cursor()
-                
-                cursor.execute("DELETE FROM detections")
-                cursor.execute("VACUUM")  # Reclaim space
+            with self._write_lock:
+                conn = self._conn()
+                with self._transaction(conn):
+                    if shadow:
+                        conn.execute("DELETE FROM mem.detections")
+                    conn.execute("DROP TABLE main.detections")
+                    conn.execute(SCHEMA_SQL)
+                self._shadow_rows = 0
+                self._count = 0
                 
-                conn.commit()
-                conn.close()
+                # Fold the WAL back into the database file and truncate it
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
                 
-                print("All detections cleared from database")
+                log.info("All detections cleared from database")
                 return True
         
         except sqlite3.Error as e:
-            print(f"Database clear error: {e}")
+            log.error("Database clear error: %s", e)
             return False
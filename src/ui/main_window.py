@@ -7,22 +7,45 @@ scanning operations.
 """
 
 import customtkinter as ctk
+import tkinter as tk
 import json
 import os
+import threading
 import time
-from queue import Queue, Empty
-from typing import List, Dict, Any, Optional
+from collections import deque
+from typing import Callable, Deque, List, Dict, Any, Optional
 from datetime import datetime
 import numpy as np
 
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+# orjson availability flag (bands.json falls back to the stdlib json parser)
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
 
 from src.core.sdr_driver import SdrDriver
-from src.core.scanner import Scanner
+from src.core.scanner import Scanner, SPECTRUM_DB_SCALE
+
+# Draw the spectrum line straight into a Tk PhotoImage (numpy rasterizer, with a dB
+# grid and frequency/dB labels) instead of rendering a Matplotlib figure through Agg;
+# set False for the full Matplotlib plot, rendered off-screen by a SpectrumRenderer thread
+USE_FAST_SPECTRUM: bool = True
+SPECTRUM_BG_RGB = (255, 255, 255)
+SPECTRUM_LINE_RGB = (0, 0, 255)
+SPECTRUM_GRID_RGB = (225, 225, 225)
+SPECTRUM_LABEL_FG = "#606060"
+
+# Matplotlib availability flag (only needed when USE_FAST_SPECTRUM is False; the
+# fast view is used either way if it is missing)
+MATPLOTLIB_AVAILABLE = False
+if not USE_FAST_SPECTRUM:
+    try:
+        from src.ui.spectrum_renderer import SpectrumRenderer
+        MATPLOTLIB_AVAILABLE = True
+    except ImportError:
+        print("Warning: matplotlib not installed, using the fast spectrum view")
 
 
 class MainWindow(ctk.CTk):
@@ -30,19 +53,33 @@ class MainWindow(ctk.CTk):
     Main application window using customtkinter.
     """
     
+    # Frequency display: 12 digits, xxx.xxx.xxx.xxx MHz, held as an integer count of
+    # its last digit (1e-9 MHz = 1 mHz). Value of one step at each digit position:
+    _DIGIT_SCALE: List[int] = [10 ** (11 - p) for p in range(12)]
+    _FREQ_UNITS_PER_HZ: int = 1000
+    
     def __init__(self) -> None:
         """
         Initialize the main application window.
         """
         super().__init__()
         
+        # Shared fonts, created once instead of one Tk font per widget
+        self._font_bold16 = ctk.CTkFont(size=16, weight="bold")
+        self._font_bold12 = ctk.CTkFont(size=12, weight="bold")
+        self._font_bold11 = ctk.CTkFont(size=11, weight="bold")
+        self._font12 = ctk.CTkFont(size=12)
+        self._font11 = ctk.CTkFont(size=11)
+        self._font10 = ctk.CTkFont(size=10)
+        self._font_mono10 = ctk.CTkFont(family="Courier", size=10)
+        
         # Configure window
         self.title("SpectrumScanner")
         # Window will auto-size after all widgets are created
         
-        # Initialize queues
-        self.result_queue: Queue = Queue()
-        self.raw_queue: Queue = Queue(maxsize=1) 
+        # Detection events from the scanner thread. A deque rather than a Queue:
+        # one producer appends and the UI pops, both atomic in CPython without a lock
+        self.result_queue: Deque[Dict[str, Any]] = deque()
         
         # Load band configuration
         self.bands: List[Dict[str, Any]] = self._load_bands()
@@ -54,15 +91,56 @@ class MainWindow(ctk.CTk):
         self.scanner: Scanner = Scanner(
             driver=self.driver,
             result_queue=self.result_queue,
-            bands=self.bands,
-            raw_data_queue=self.raw_queue
+            bands=self.bands
         )
+        self._refresh_scanner_bindings()
+        
+        # Mode and manual frequency as last set from this window, so poll_queue's
+        # status line doesn't take the scanner lock on every pass
+        self._manual_mode: bool = self.scanner.is_manual_mode()
+        self._manual_freq_hz: float = self.scanner.get_manual_freq()
         
         # Scanning state tracking
         self.is_scanning: bool = False
         self.max_log_entries: int = 100
+        # Lines currently in the log textbox, oldest first (mirrors the widget)
+        self._log_lines: Deque[str] = deque(maxlen=self.max_log_entries)
+        
+        # Adaptive polling: poll_queue runs every poll_min_ms while events or
+        # spectra arrive, backing off geometrically to poll_max_ms when idle.
+        # With the scanner paused nothing can arrive, so polling parks
+        # (_poll_id None) until _wake_poll() is called from a UI action
+        self.poll_max_fps: int = 50
+        self.poll_min_ms: int = 1000 // self.poll_max_fps
+        self.poll_max_ms: int = 250
+        self._idle_polls: int = 0
+        self._poll_id: Optional[str] = None
+        
+        # SDR connect/disconnect runs on a worker thread; its UI continuation is
+        # queued here and run by poll_queue
+        self._sdr_busy: bool = False
+        self._ui_calls: Deque[Callable[[], None]] = deque()
+        
+        # Pending debounced slider actions: key -> after() id (see _debounce)
+        self._debounce_ids: Dict[str, str] = {}
+        # Last value each slider callback handled (see _slider_changed)
+        self._slider_values: Dict[str, float] = {}
+        
         self.detection_count: int = 0
         
+        # What the counter and status labels currently show, so unchanged values
+        # skip the Tk configure call; the counter redraws at most every 0.1 s
+        self._shown_count: int = -1
+        self._counter_shown_at: float = 0.0
+        self.counter_min_interval_s: float = 0.1
+        self._last_status: Optional[tuple] = None
+        
+        # Detection lines waiting for the log textbox, which is written at most
+        # every log_min_interval_s however fast detections arrive
+        self._pending_log_lines: List[str] = []
+        self._log_flushed_at: float = 0.0
+        self.log_min_interval_s: float = 0.1
+        
         # Create GUI components
         self._create_widgets()
         
@@ -128,14 +206,23 @@ class MainWindow(ctk.CTk):
             print(f"Error saving state: {e}")
 
     def _load_bands(self) -> List[Dict[str, Any]]:
-        """Load band configuration from bands.json."""
+        """Load band configuration from bands.json (and the enabled-bands lookup and label)."""
         bands_path: str = "src/config/bands.json"
         try:
-            with open(bands_path, "r") as f:
-                return json.load(f)
+            with open(bands_path, "rb") as f:
+                data = f.read()
+            bands = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
         except Exception as e:
             print(f"Error loading bands: {e}")
-            return []
+            bands = []
+        # Enabled bands by name (config order), and the info label text built once
+        self._enabled_bands: Dict[str, Dict[str, Any]] = {
+            b.get("name", "Unknown"): b for b in bands if b.get("enabled", False)
+        }
+        self._band_label_text: str = (
+            f"Enabled Bands: {', '.join(self._enabled_bands) if self._enabled_bands else 'None'}"
+        )
+        return bands
     
     def _create_sidebar(self) -> None:
         """
@@ -149,7 +236,7 @@ class MainWindow(ctk.CTk):
         mode_frame = ctk.CTkFrame(sidebar)
         mode_frame.pack(fill="x", padx=5, pady=(0, 15))
         
-        mode_label = ctk.CTkLabel(mode_frame, text="Mode", font=ctk.CTkFont(size=12, weight="bold"))
+        mode_label = ctk.CTkLabel(mode_frame, text="Mode", font=self._font_bold12)
         mode_label.pack(pady=(5, 5))
         
         self.mode_button = ctk.CTkSegmentedButton(
@@ -164,7 +251,7 @@ class MainWindow(ctk.CTk):
         demod_frame = ctk.CTkFrame(sidebar)
         demod_frame.pack(fill="x", padx=5, pady=(0, 15))
         
-        demod_label = ctk.CTkLabel(demod_frame, text="Demod Mode", font=ctk.CTkFont(size=12, weight="bold"))
+        demod_label = ctk.CTkLabel(demod_frame, text="Demod Mode", font=self._font_bold12)
         demod_label.pack(pady=(5, 5))
         
         self.demod_mode = ctk.StringVar(value="NFM")
@@ -184,10 +271,10 @@ class MainWindow(ctk.CTk):
         tuning_frame = ctk.CTkFrame(sidebar)
         tuning_frame.pack(fill="x", padx=5, pady=(0, 15))
         
-        tuning_label = ctk.CTkLabel(tuning_frame, text="Tuning", font=ctk.CTkFont(size=12, weight="bold"))
+        tuning_label = ctk.CTkLabel(tuning_frame, text="Tuning", font=self._font_bold12)
         tuning_label.pack(pady=(5, 5))
         
-        freq_entry_label = ctk.CTkLabel(tuning_frame, text="Frequency (MHz)", font=ctk.CTkFont(size=10))
+        freq_entry_label = ctk.CTkLabel(tuning_frame, text="Frequency (MHz)", font=self._font10)
         freq_entry_label.pack(anchor="w", padx=5, pady=(0, 2))
         
         # Digit-by-digit frequency entry with up/down controls
@@ -196,12 +283,19 @@ class MainWindow(ctk.CTk):
         
         self.freq_digits = []
         self.freq_labels = []
+        # All arrow buttons in one flat list, and the state they were last set to
+        self._digit_buttons: List[ctk.CTkButton] = []
+        self._digit_button_state: str = "disabled"
+        # Displayed frequency as an integer (see _DIGIT_SCALE), plus the digits last
+        # written to the labels so unchanged ones are skipped
+        self._freq_units: int = 0
+        self._last_freq_str: str = "0" * 12
         digit_positions = [0, 1, 2, None, 3, 4, 5, None, 6, 7, 8, None, 9, 10, 11]  # None = dot separator
         
         for idx, pos in enumerate(digit_positions):
             if pos is None:
                 # Add dot separator
-                dot_label = ctk.CTkLabel(digit_container, text=".", font=ctk.CTkFont(size=16, weight="bold"), width=10)
+                dot_label = ctk.CTkLabel(digit_container, text=".", font=self._font_bold16, width=10)
                 dot_label.grid(row=1, column=idx, padx=2)
             else:
                 # Create digit column with up/down arrows
@@ -211,22 +305,23 @@ class MainWindow(ctk.CTk):
                 # Up arrow
                 up_btn = ctk.CTkButton(digit_frame, text="▲", width=30, height=20, 
                                       command=lambda p=pos: self._increment_digit(p),
-                                      font=ctk.CTkFont(size=10), state="disabled")
+                                      font=self._font10, state="disabled")
                 up_btn.pack()
                 
                 # Digit display
-                digit_label = ctk.CTkLabel(digit_frame, text="0", font=ctk.CTkFont(size=16, weight="bold"),
+                digit_label = ctk.CTkLabel(digit_frame, text=self._last_freq_str[pos], font=self._font_bold16,
                                           width=30, height=30, fg_color="#2b2b2b", corner_radius=5)
                 digit_label.pack(pady=2)
                 
                 # Down arrow
                 down_btn = ctk.CTkButton(digit_frame, text="▼", width=30, height=20,
                                         command=lambda p=pos: self._decrement_digit(p),
-                                        font=ctk.CTkFont(size=10), state="disabled")
+                                        font=self._font10, state="disabled")
                 down_btn.pack()
                 
                 self.freq_digits.append(digit_label)
                 self.freq_labels.append((up_btn, down_btn))
+                self._digit_buttons += (up_btn, down_btn)
         
         # Initialize frequency display to 146.520.000.000
         self._set_frequency_display(146.520)
@@ -235,7 +330,7 @@ class MainWindow(ctk.CTk):
         settings_frame = ctk.CTkFrame(sidebar)
         settings_frame.pack(fill="both", expand=True, padx=5, pady=(0, 10))
         
-        settings_label = ctk.CTkLabel(settings_frame, text="Settings", font=ctk.CTkFont(size=12, weight="bold"))
+        settings_label = ctk.CTkLabel(settings_frame, text="Settings", font=self._font_bold12)
         settings_label.pack(pady=(5, 10))
         
         # Spectrum Display Toggle (disabled by default for better responsiveness)
@@ -245,7 +340,7 @@ class MainWindow(ctk.CTk):
         spectrum_check.pack(anchor="w", padx=10, pady=(0, 10))
         
         # Squelch Level
-        ctk.CTkLabel(settings_frame, text="Squelch Level", font=ctk.CTkFont(size=11, weight="bold")).pack(pady=(5, 0))
+        ctk.CTkLabel(settings_frame, text="Squelch Level", font=self._font_bold11).pack(pady=(5, 0))
         self.squelch_value_label = ctk.CTkLabel(settings_frame, text="-40.0 dB", text_color="#3498db")
         self.squelch_value_label.pack(pady=(0, 2))
         self.squelch_slider = ctk.CTkSlider(settings_frame, from_=-100, to=0, number_of_steps=100, command=self._on_squelch_change)
@@ -253,7 +348,7 @@ class MainWindow(ctk.CTk):
         self.squelch_slider.pack(fill="x", padx=5, pady=(0, 10))
         
         # Gain
-        ctk.CTkLabel(settings_frame, text="Gain (dB)", font=ctk.CTkFont(size=11, weight="bold")).pack(pady=(5, 0))
+        ctk.CTkLabel(settings_frame, text="Gain (dB)", font=self._font_bold11).pack(pady=(5, 0))
         self.gain_value_label = ctk.CTkLabel(settings_frame, text="Auto", text_color="#3498db")
         self.gain_value_label.pack(pady=(0, 2))
         self.gain_slider = ctk.CTkSlider(settings_frame, from_=0, to=50, number_of_steps=50, command=self._on_gain_change)
@@ -261,7 +356,7 @@ class MainWindow(ctk.CTk):
         self.gain_slider.pack(fill="x", padx=5, pady=(0, 10))
         
         # Threshold
-        ctk.CTkLabel(settings_frame, text="Threshold (dB)", font=ctk.CTkFont(size=11, weight="bold")).pack(pady=(5, 0))
+        ctk.CTkLabel(settings_frame, text="Threshold (dB)", font=self._font_bold11).pack(pady=(5, 0))
         self.threshold_value_label = ctk.CTkLabel(settings_frame, text="10.0 dB", text_color="#3498db")
         self.threshold_value_label.pack(pady=(0, 2))
         self.threshold_slider = ctk.CTkSlider(settings_frame, from_=0, to=30, number_of_steps=60, command=self._on_threshold_change)
@@ -270,7 +365,7 @@ class MainWindow(ctk.CTk):
 
 
         # Volume
-        ctk.CTkLabel(settings_frame, text="Volume", font=ctk.CTkFont(size=11, weight="bold")).pack(pady=(5, 0))
+        ctk.CTkLabel(settings_frame, text="Volume", font=self._font_bold11).pack(pady=(5, 0))
         self.volume_value_label = ctk.CTkLabel(settings_frame, text="50%", text_color="#3498db")
         self.volume_value_label.pack(pady=(0, 2))
         self.volume_slider = ctk.CTkSlider(settings_frame, from_=0, to=100, number_of_steps=100, command=self._on_volume_change)
@@ -278,7 +373,7 @@ class MainWindow(ctk.CTk):
         self.volume_slider.pack(fill="x", padx=5, pady=(0, 10))
         
         # Buffer
-        ctk.CTkLabel(settings_frame, text="Buffer Size", font=ctk.CTkFont(size=11, weight="bold")).pack(pady=(5, 0))
+        ctk.CTkLabel(settings_frame, text="Buffer Size", font=self._font_bold11).pack(pady=(5, 0))
         self.buffer_value_label = ctk.CTkLabel(settings_frame, text="130k", text_color="#3498db")
         self.buffer_value_label.pack(pady=(0, 2))
         self.buffer_slider = ctk.CTkSlider(settings_frame, from_=50000, to=500000, number_of_steps=450, command=self._on_buffer_change)
@@ -286,7 +381,7 @@ class MainWindow(ctk.CTk):
         self.buffer_slider.pack(fill="x", padx=5, pady=(0, 10))
         
         # PPM Correction
-        ctk.CTkLabel(settings_frame, text="PPM Correction", font=ctk.CTkFont(size=11, weight="bold")).pack(pady=(5, 0))
+        ctk.CTkLabel(settings_frame, text="PPM Correction", font=self._font_bold11).pack(pady=(5, 0))
         self.ppm_value_label = ctk.CTkLabel(settings_frame, text="0 ppm", text_color="#3498db")
         self.ppm_value_label.pack(pady=(0, 2))
         self.ppm_slider = ctk.CTkSlider(settings_frame, from_=-100, to=100, number_of_steps=200, command=self._on_ppm_change)
@@ -309,7 +404,7 @@ class MainWindow(ctk.CTk):
         header_frame.grid(row=0, column=1, sticky="ew", padx=10, pady=10)
         header_frame.grid_columnconfigure(1, weight=1)
         
-        title_label = ctk.CTkLabel(header_frame, text="SpectrumScanner - RTL-SDR Monitor", font=ctk.CTkFont(size=16, weight="bold"))
+        title_label = ctk.CTkLabel(header_frame, text="SpectrumScanner - RTL-SDR Monitor", font=self._font_bold16)
         title_label.grid(row=0, column=0, columnspan=3, pady=(0, 10))
         
         # --- Control Frame ---
@@ -323,7 +418,7 @@ class MainWindow(ctk.CTk):
         self.stop_button = ctk.CTkButton(control_frame, text="Stop", command=self._on_stop_scan, fg_color="#e74c3c", state="disabled")
         self.stop_button.grid(row=0, column=1, padx=5)
         
-        self.status_label = ctk.CTkLabel(control_frame, text="Status: Idle", font=ctk.CTkFont(size=12), text_color="#95a5a6")
+        self.status_label = ctk.CTkLabel(control_frame, text="Status: Idle", font=self._font12, text_color="#95a5a6")
         self.status_label.grid(row=0, column=2, padx=20, sticky="e")
         
         # --- Spectrum Plot Frame ---
@@ -332,21 +427,23 @@ class MainWindow(ctk.CTk):
         spectrum_frame.grid_rowconfigure(0, weight=1)
         spectrum_frame.grid_columnconfigure(0, weight=1)
         
-        self.spectrum_fig = Figure(figsize=(8, 3), dpi=100)
-        self.spectrum_ax = self.spectrum_fig.add_subplot(111)
-        self.spectrum_ax.set_xlabel('Frequency (MHz)', fontsize=9)
-        self.spectrum_ax.set_ylabel('Power (dB)', fontsize=9)
-        self.spectrum_ax.set_title('Real-Time Spectrum', fontsize=10, weight='bold')
-        self.spectrum_ax.grid(True, alpha=0.3)
-        self.spectrum_ax.tick_params(labelsize=8)
-        self.spectrum_line, = self.spectrum_ax.plot([], [], 'b-', linewidth=1)
-        self.spectrum_ax.set_xlim(0, 1000)
-        self.spectrum_ax.set_ylim(-80, 0)
-        self.spectrum_fig.tight_layout()
-        
-        self.spectrum_canvas = FigureCanvasTkAgg(self.spectrum_fig, master=spectrum_frame)
-        self.spectrum_canvas.draw()
-        self.spectrum_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+        # Axis limits and redraw throttling, shared by both spectrum renderers
+        self.spectrum_xlim = (0.0, 1000.0)  # MHz
+        self._spectrum_xlim_hz = (0.0, 1e9)  # Same range in Hz, for the float64 fast-view mapping
+        self.spectrum_ylim = (-80.0, 0.0)
+        self.spectrum_frame_count: int = 0
+        self.spectrum_autoscale_every: int = 10  # Frames between y-axis rescale checks
+        self.spectrum_ylim_hysteresis_db: float = 3.0
+        self.spectrum_min_interval_s: float = 0.05  # Draw at most 20 frames per second
+        self._last_spec_draw: float = 0.0
+        # UI-thread time per frame (moving average); the interval widens past
+        # spectrum_min_interval_s so drawing takes at most this share of the thread
+        self.spectrum_max_ui_share: float = 0.25
+        self._spec_draw_cost_s: float = 0.0
+        self._spec_submit_cost_s: float = 0.0  # Renderer path: prep cost awaiting its frame
+        
+        self._create_spectrum_view(spectrum_frame)
+        self.spectrum_widget.grid(row=0, column=0, sticky="nsew")
         
         # --- Log Frame ---
         log_frame = ctk.CTkFrame(self)
@@ -354,8 +451,8 @@ class MainWindow(ctk.CTk):
         log_frame.grid_rowconfigure(1, weight=1)
         log_frame.grid_columnconfigure(0, weight=1)
         
-        ctk.CTkLabel(log_frame, text="Detection Log", font=ctk.CTkFont(size=12, weight="bold")).grid(row=0, column=0, sticky="w", pady=(0, 5))
-        self.log_textbox = ctk.CTkTextbox(log_frame, font=ctk.CTkFont(family="Courier", size=10), state="disabled")
+        ctk.CTkLabel(log_frame, text="Detection Log", font=self._font_bold12).grid(row=0, column=0, sticky="w", pady=(0, 5))
+        self.log_textbox = ctk.CTkTextbox(log_frame, font=self._font_mono10, state="disabled")
         self.log_textbox.grid(row=1, column=0, sticky="nsew")
         
         # --- Info Frame ---
@@ -363,12 +460,10 @@ class MainWindow(ctk.CTk):
         info_frame.grid(row=4, column=1, sticky="ew", padx=10, pady=5)
         info_frame.grid_columnconfigure(0, weight=1)
         
-        self.counter_label = ctk.CTkLabel(info_frame, text="Detections: 0", font=ctk.CTkFont(size=11), text_color="#3498db")
+        self.counter_label = ctk.CTkLabel(info_frame, text="Detections: 0", font=self._font11, text_color="#3498db")
         self.counter_label.grid(row=0, column=0, sticky="w")
         
-        enabled_bands = [b.get("name", "Unknown") for b in self.bands if b.get("enabled", False)]
-        band_text = f"Enabled Bands: {', '.join(enabled_bands) if enabled_bands else 'None'}"
-        self.band_label = ctk.CTkLabel(info_frame, text=band_text, font=ctk.CTkFont(size=10), text_color="#95a5a6")
+        self.band_label = ctk.CTkLabel(info_frame, text=self._band_label_text, font=self._font10, text_color="#95a5a6")
         self.band_label.grid(row=1, column=0, sticky="w")
         
         # Initialize Manual Radio mode after all widgets are created
@@ -377,80 +472,167 @@ class MainWindow(ctk.CTk):
         # Auto-size window to fit all controls
         self.after(100, self._auto_size_window)
     
+    def _create_spectrum_view(self, parent) -> None:
+        """Create the spectrum view: a Label showing a PhotoImage, drawn by either renderer."""
+        # Fixed requested size (pixels, as the label shows an image), so the image
+        # can follow the label's actual size without the label growing to fit it
+        self.spectrum_photo = tk.PhotoImage(width=800, height=300)
+        self.spectrum_widget = tk.Label(
+            parent, image=self.spectrum_photo, width=800, height=300,
+            borderwidth=0, highlightthickness=0, padx=0, pady=0
+        )
+        self._spectrum_buf: Optional[np.ndarray] = None  # (height, width, 3) RGB
+        self._spectrum_ppm_header: bytes = b""
+        
+        # View size from <Configure> (no winfo_* round-trips per frame), and the last
+        # spectrum received, redrawn at the new size when the view is resized
+        self._spectrum_size = (800, 300)
+        self._last_spectrum = None
+        self.spectrum_widget.bind("<Configure>", self._on_spectrum_resize)
+        # Reused float32 buffer for the per-frame dB conversion (fast view only; grown
+        # on demand). Frequencies stay float64 Hz: float32 MHz would quantize to
+        # ~122 Hz at 1 GHz.
+        self._power_db_buf: np.ndarray = np.empty(0, dtype=np.float32)
+        
+        # Fast view axes: dB grid rows drawn into the image and text labels placed
+        # over it, rebuilt only when the limits or the view size change
+        self._spectrum_axes_key = None
+        self._spectrum_grid_rows: np.ndarray = np.empty(0, dtype=np.intp)
+        self._spectrum_axis_labels: List[tk.Label] = []
+        
+        # Matplotlib fallback: rendered off-screen on its own thread
+        self.spectrum_renderer = None
+        if not USE_FAST_SPECTRUM and MATPLOTLIB_AVAILABLE:
+            self.spectrum_renderer = SpectrumRenderer()
+            self.spectrum_renderer.start()
+    
     def _set_frequency_display(self, freq_mhz: float) -> None:
         """Update the digit display with a frequency value."""
-        # Format: xxx.xxx.xxx.xxx (12 digits total)
+        self._freq_units = min(max(round(freq_mhz * 1e9), 0), 10 ** 12 - 1)
+        self._refresh_frequency_digits()
+    
+    def _refresh_frequency_digits(self) -> None:
+        """Write _freq_units to the digit labels, configuring only digits that changed."""
+        # Format: xxx.xxx.xxx.xxx (12 digits total, 9 after the MHz point)
         # Example: 146.520 MHz = 146.520000000
-        freq_str = f"{freq_mhz:012.6f}".replace(".", "")
-        for i, digit_label in enumerate(self.freq_digits):
-            digit_label.configure(text=freq_str[i] if i < len(freq_str) else "0")
+        freq_str = f"{self._freq_units:012d}"
+        for i, ch in enumerate(freq_str):
+            if ch != self._last_freq_str[i]:
+                self.freq_digits[i].configure(text=ch)
+        self._last_freq_str = freq_str
     
     def _get_frequency_from_display(self) -> float:
-        """Read the frequency from the digit display."""
-        freq_str = "".join([label.cget("text") for label in self.freq_digits])
-        # Insert decimal point after 3rd digit: xxx.xxxxxxxxx
-        freq_with_decimal = freq_str[:3] + "." + freq_str[3:]
-        return float(freq_with_decimal)
+        """Read the frequency shown in the digit display, in MHz."""
+        return self._freq_units / 1e9
+    
+    def _step_digit(self, position: int, delta: int) -> None:
+        """Step the frequency by delta units of one digit (carrying) and retune."""
+        freq_units = self._freq_units + delta * self._DIGIT_SCALE[position]
+        if not 0 <= freq_units < 10 ** 12:
+            return
+        self._freq_units = freq_units
+        self._refresh_frequency_digits()
+        self._apply_frequency_change()
     
     def _increment_digit(self, position: int) -> None:
         """Increment a specific digit position."""
-        current = int(self.freq_digits[position].cget("text"))
-        new_value = (current + 1) % 10
-        self.freq_digits[position].configure(text=str(new_value))
-        self._apply_frequency_change()
+        self._step_digit(position, 1)
     
     def _decrement_digit(self, position: int) -> None:
         """Decrement a specific digit position."""
-        current = int(self.freq_digits[position].cget("text"))
-        new_value = (current - 1) % 10
-        self.freq_digits[position].configure(text=str(new_value))
-        self._apply_frequency_change()
+        self._step_digit(position, -1)
     
     def _apply_frequency_change(self) -> None:
         """Apply the frequency shown in the digit display."""
         try:
             freq_mhz = self._get_frequency_from_display()
-            freq_hz = freq_mhz * 1e6
+            freq_hz = self._freq_units / self._FREQ_UNITS_PER_HZ
+            # The scanner thread owns the SDR while running and retunes to the
+            # new manual frequency before its next read
             self.scanner.set_manual_freq(freq_hz)
-            
-            # If scanner is running, immediately tune the hardware
-            if self.is_scanning and self.driver.is_connected:
-                self.driver.tune(freq_hz)
+            self._manual_freq_hz = freq_hz
             
             print(f"Tuned to {freq_mhz:.6f} MHz")
-            # Save frequency to config
-            self._save_frequency_and_volume()
+            # Save frequency to config once the digits stop changing
+            self._debounce("state_save", 500, self._save_frequency_and_volume)
         except Exception as e:
             print(f"Error applying frequency: {e}")
     
     def _on_gain_change(self, value: float) -> None:
         gain: float = float(value)
+        if not self._slider_changed("gain", gain): return
         if gain == 0:
             self.gain_value_label.configure(text="Auto")
         else:
             self.gain_value_label.configure(text=f"{gain:.1f} dB")
-        self.scanner.set_gain(gain)
+        self._debounce("gain", 80, lambda: self.scanner.set_gain(gain))
     
     def _on_threshold_change(self, value: float) -> None:
         threshold: float = float(value)
+        if not self._slider_changed("threshold", threshold): return
         self.threshold_value_label.configure(text=f"{threshold:.1f} dB")
-        self.scanner.set_threshold(threshold)
+        self._debounce("threshold", 80, lambda: self.scanner.set_threshold(threshold))
+    
+    def _slider_changed(self, key: str, value: float) -> bool:
+        """
+        Record a slider value, returning False if it equals the last one handled.
+        
+        Stepped sliders report the same step repeatedly while dragged within
+        it; those repeats skip the label configure and the debounced setter.
+        """
+        if self._slider_values.get(key) == value:
+            return False
+        self._slider_values[key] = value
+        return True
+    
+    def _debounce(self, key: str, delay_ms: int, fn) -> None:
+        """
+        Run fn after delay_ms, cancelling any call still pending under the same key.
+        
+        Slider callbacks fire for every pixel of a drag; labels update at once,
+        but the scanner/SDR only receives the value the slider settles on.
+        """
+        after_id = self._debounce_ids.pop(key, None)
+        if after_id is not None:
+            self.after_cancel(after_id)
+        
+        def run() -> None:
+            self._debounce_ids.pop(key, None)
+            fn()
+        
+        self._debounce_ids[key] = self.after(delay_ms, run)
+    
+    def _refresh_scanner_bindings(self) -> None:
+        """
+        Look up the optional scanner/demodulator setters once, so slider callbacks
+        don't repeat the hasattr checks. Call again if the demodulator is replaced.
+        """
+        demodulator = getattr(self.scanner, 'demodulator', None)
+        self._set_volume_fn = getattr(demodulator, 'set_volume', None)
+        self._set_squelch_fn = getattr(self.scanner, 'set_squelch', None)
     
     def _on_squelch_change(self, value: float) -> None:
         squelch_db = float(value)
+        if not self._slider_changed("squelch", squelch_db): return
         self.squelch_value_label.configure(text=f"{squelch_db:.1f} dB")
-        if hasattr(self.scanner, 'set_squelch'):
-             self.scanner.set_squelch(squelch_db)
+        if self._set_squelch_fn is not None:
+            set_squelch = self._set_squelch_fn
+            self._debounce("squelch", 80, lambda: set_squelch(squelch_db))
     
     def _on_mode_change(self, mode: str) -> None:
         is_manual = (mode == "Manual Radio")
         self.scanner.toggle_mode(is_manual)
+        self._manual_mode = is_manual
+        self._wake_poll()  # Status label follows the mode
         state = "normal" if is_manual else "disabled"
         
-        # Enable/disable digit controls
-        for up_btn, down_btn in self.freq_labels:
-            up_btn.configure(state=state)
-            down_btn.configure(state=state)
+        # Enable/disable digit controls (each configure redraws a CTkButton, so
+        # only when the state actually changes)
+        if state == self._digit_button_state:
+            return
+        self._digit_button_state = state
+        for button in self._digit_buttons:
+            button.configure(state=state)
     
     def _on_spectrum_toggle(self) -> None:
         """Handle spectrum display toggle."""
@@ -466,70 +648,104 @@ class MainWindow(ctk.CTk):
     
     def _on_volume_change(self, value: float) -> None:
         vol = int(float(value))
+        if not self._slider_changed("volume", vol): return
         self.volume_value_label.configure(text=f"{vol}%")
-        if hasattr(self.scanner, 'demodulator') and self.scanner.demodulator:
-            if hasattr(self.scanner.demodulator, 'set_volume'):
-                self.scanner.demodulator.set_volume(vol / 100.0)
-        # Save volume to config
-        self._save_frequency_and_volume()
+        if self._set_volume_fn is not None:
+            self._set_volume_fn(vol / 100.0)
+        # Save volume to config (a file write, so only once the slider settles)
+        self._debounce("state_save", 500, self._save_frequency_and_volume)
     
     def _on_buffer_change(self, value: float) -> None:
         buf = int(float(value))
+        if not self._slider_changed("buffer", buf): return
         self.buffer_value_label.configure(text=f"{buf/1000:.0f}k")
-        self.scanner.set_buffer_size(buf)
+        self._debounce("buffer", 80, lambda: self.scanner.set_buffer_size(buf))
     
     def _on_ppm_change(self, value: float) -> None:
         ppm = int(float(value))
+        if not self._slider_changed("ppm", ppm): return
         self.ppm_value_label.configure(text=f"{ppm} ppm")
         
-        # If running, stop temporarily to apply PPM correction cleanly
-        was_running = self.is_scanning
-        if was_running:
-            self.scanner.stop_scan()
-            time.sleep(0.1)  # Brief pause for thread to stop
+        # Applying restarts the SDR, so wait longer for the slider to settle
+        self._debounce("ppm", 250, lambda: self._apply_ppm(ppm))
+    
+    def _apply_ppm(self, ppm: int) -> None:
+        """Apply a PPM correction, restarting the scanner around it if it is running."""
+        if self._sdr_busy:
+            # Connect/disconnect in progress; try again once it has finished
+            self._debounce("ppm", 250, lambda: self._apply_ppm(ppm))
+            return
+        if not self.is_scanning:
+            self.driver.set_ppm_correction(ppm)
+            return
         
-        # Apply PPM correction
-        self.driver.set_ppm_correction(ppm)
+        # stop_scan() waits for the scan loop to settle, so the restart runs off
+        # the UI thread like connect/disconnect
+        self._sdr_busy = True
+        current_freq = self._manual_freq_hz if self._manual_mode else None
         
-        # Restart if it was running
-        if was_running:
-            if self.scanner.is_manual_mode():
-                current_freq = self.scanner.get_manual_freq()
+        def work() -> None:
+            self.scanner.stop_scan()
+            self.driver.set_ppm_correction(ppm)
+            if current_freq is not None:
                 self.driver.tune(current_freq)
                 print(f"Re-tuned to {current_freq/1e6:.3f} MHz with PPM {ppm}")
             self.scanner.start_scan()
-        ppm = int(float(value))
-        self.ppm_value_label.configure(text=f"{ppm} ppm")
         
-        # If running, stop temporarily to apply PPM correction cleanly
-        was_running = self.is_scanning
-        if was_running:
-            self.scanner.stop_scan()
-            time.sleep(0.1)  # Brief pause for thread to stop
+        self._run_in_background(work, self._finish_ppm_change)
+    
+    def _finish_ppm_change(self, result: None) -> None:
+        self._sdr_busy = False
+    
+    def _run_in_background(self, work: Callable[[], Any], done: Callable[[Any], None]) -> None:
+        """
+        Run blocking hardware I/O off the UI thread, then hand the result back.
         
-        # Apply PPM correction
-        self.driver.set_ppm_correction(ppm)
+        The worker never touches Tk: it queues done(result) in _ui_calls, which
+        poll_queue runs on the UI thread.
         
-        # Restart if it was running
-        if was_running:
-            if self.scanner.is_manual_mode():
-                current_freq = self.scanner.get_manual_freq()
-                self.driver.tune(current_freq)
-                print(f"Re-tuned to {current_freq/1e6:.3f} MHz with PPM {ppm}")
-            self.scanner.start_scan()
+        Args:
+            work: Blocking call to run on a worker thread
+            done: UI-thread continuation receiving work()'s result (None on error)
+        """
+        def worker() -> None:
+            result = None
+            try:
+                result = work()
+            except Exception as e:
+                print(f"Error in background SDR operation: {e}")
+            self._ui_calls.append(lambda: done(result))
+        
+        self._wake_poll()
+        threading.Thread(target=worker, name="sdr-io", daemon=True).start()
     
     def _on_start_scan(self) -> None:
-        if self.is_scanning: return
-        if not self.driver.connect():
-            self._update_log("ERROR: Failed to connect to SDR")
-            self._update_status("Error: No SDR", "#e74c3c")
-            return
-        if not self.scanner.start_scan():
-            self._update_log("ERROR: Failed to start scanner")
-            self.driver.disconnect()
+        if self.is_scanning or self._sdr_busy: return
+        # Disable right away so a second click can't queue another connect
+        self._sdr_busy = True
+        self.start_button.configure(state="disabled")
+        
+        def work() -> str:
+            if not self.driver.connect():
+                return "connect"
+            if not self.scanner.start_scan():
+                self.driver.disconnect()
+                return "start"
+            return "ok"
+        
+        self._run_in_background(work, self._finish_start_scan)
+    
+    def _finish_start_scan(self, result: Optional[str]) -> None:
+        self._sdr_busy = False
+        if result != "ok":
+            self.start_button.configure(state="normal")
+            if result == "connect":
+                self._update_log("ERROR: Failed to connect to SDR")
+                self._update_status("Error: No SDR", "#e74c3c")
+            else:
+                self._update_log("ERROR: Failed to start scanner")
             return
         self.is_scanning = True
-        self.start_button.configure(state="disabled")
         self.stop_button.configure(state="normal")
         self._update_status("Scanning", "#2ecc71")
         self._update_log("Scan resumed")
@@ -537,29 +753,69 @@ class MainWindow(ctk.CTk):
         self._update_counter()
     
     def _on_stop_scan(self) -> None:
-        if not self.is_scanning: return
-        self.scanner.stop_scan()
-        self.driver.disconnect()
+        if not self.is_scanning or self._sdr_busy: return
+        self._sdr_busy = True
         self.is_scanning = False
-        self.start_button.configure(state="normal")
         self.stop_button.configure(state="disabled")
+        
+        def work() -> None:
+            self.scanner.stop_scan()
+            self.driver.disconnect()
+        
+        self._run_in_background(work, self._finish_stop_scan)
+    
+    def _finish_stop_scan(self, result: None) -> None:
+        self._sdr_busy = False
+        self.start_button.configure(state="normal")
         self._update_status("Idle", "#95a5a6")
         self._update_log("Scan paused")
     
     def poll_queue(self) -> None:
+        # Continuations posted by background SDR operations
+        had_work = bool(self._ui_calls)
+        while self._ui_calls:
+            self._ui_calls.popleft()()
+        
+        # Drain every pending event; the log and counter are then updated once
+        batch: List[Dict[str, Any]] = []
         try:
             while True:
-                event = self.result_queue.get_nowait()
-                self._handle_detection_event(event)
-        except Empty: pass
+                batch.append(self.result_queue.popleft())
+        except IndexError:
+            pass
+        had_work = had_work or bool(batch)
+        if batch:
+            lines = [line for line in (self._format_detection_event(e) for e in batch) if line]
+            self._pending_log_lines += lines
+            self.detection_count += len(lines)
         
-        try:
-            freqs, power = self.raw_queue.get_nowait()
-            self._update_spectrum_plot(freqs, power)
-        except Empty: pass
+        # Rate-limited log and counter refresh (caught up by later polls)
+        now = time.monotonic()
+        if self._pending_log_lines and now - self._log_flushed_at >= self.log_min_interval_s:
+            self._flush_pending_log()
+        if (self.detection_count != self._shown_count
+                and now - self._counter_shown_at >= self.counter_min_interval_s):
+            self._update_counter()
+        # Keep polling (not parked) until both have caught up
+        had_work = had_work or bool(self._pending_log_lines) or self.detection_count != self._shown_count
+        
+        # Latest spectrum only; older frames were never kept
+        spectrum = self.scanner.take_spectrum()
+        if spectrum is not None:
+            had_work = True
+            self._update_spectrum_plot(*spectrum)
         
-        if self.scanner.is_manual_mode():
-            freq = self.scanner.get_manual_freq() / 1e6
+        # Frames finished by the Matplotlib render thread
+        if self.spectrum_renderer is not None:
+            frame = self.spectrum_renderer.take_frame()
+            if frame is not None:
+                had_work = True
+                start = time.monotonic()
+                self._show_spectrum_frame(*frame)
+                self._note_spectrum_cost(self._spec_submit_cost_s + time.monotonic() - start)
+        
+        if self._manual_mode:
+            freq = self._manual_freq_hz / 1e6
             status = "Manual" if not self.is_scanning else f"Manual: {freq:.3f} MHz"
             color = "#e74c3c" if self.is_scanning else "#95a5a6"
             self._update_status(status, color)
@@ -567,46 +823,357 @@ class MainWindow(ctk.CTk):
             status = "Scanning" if self.is_scanning else "Scanner Idle"
             color = "#27ae60" if self.is_scanning else "#95a5a6"
             self._update_status(status, color)
-            
-        self.after(100, self.poll_queue)
+        
+        if had_work:
+            self._idle_polls = 0
+            delay = self.poll_min_ms
+        elif not (self.is_scanning or self._sdr_busy
+                  or (self.spectrum_renderer is not None and self.spectrum_renderer.pending)):
+            self._poll_id = None  # Parked: no producer is running
+            return
+        else:
+            self._idle_polls += 1
+            delay = min(self.poll_max_ms, self.poll_min_ms << min(self._idle_polls, 4))
+        self._poll_id = self.after(delay, self.poll_queue)
+    
+    def _wake_poll(self) -> None:
+        """
+        Reset poll_queue to its fastest rate, rescheduling it if it was parked.
+        """
+        self._idle_polls = 0
+        if self._poll_id is None:
+            self._poll_id = self.after(self.poll_min_ms, self.poll_queue)
     
-    def _handle_detection_event(self, event: Dict[str, Any]) -> None:
+    def _format_detection_event(self, event: Dict[str, Any]) -> Optional[str]:
         try:
-            ts = event.get("timestamp", "").split("T")[1][:8]
+            # ISO 8601 from the scanner: HH:MM:SS is always at [11:19]
+            ts_raw = event.get("timestamp", "")
+            ts = ts_raw[11:19] if len(ts_raw) >= 19 else ""
             freq = event.get("frequency_hz", 0) / 1e6
             pwr = event.get("relative_power_db", 0)
             band = event.get("band_name", "Unknown")
-            self._update_log(f"[{ts}] {freq:10.4f} MHz | Power: {pwr:6.1f} dB | Band: {band}")
-            self.detection_count += 1
-            self._update_counter()
-        except Exception as e: print(f"Error handling event: {e}")
+            return f"[{ts}] {freq:10.4f} MHz | Power: {pwr:6.1f} dB | Band: {band}"
+        except Exception as e:
+            print(f"Error handling event: {e}")
+            return None
     
-    def _update_spectrum_plot(self, frequencies: np.ndarray, power_spectrum: np.ndarray) -> None:
-        try:
-            freq_mhz = frequencies / 1e6
-            self.spectrum_line.set_xdata(freq_mhz)
-            self.spectrum_line.set_ydata(power_spectrum)
-            self.spectrum_ax.set_xlim(freq_mhz.min(), freq_mhz.max())
-            p_min, p_max = power_spectrum.min(), power_spectrum.max()
+    def _spectrum_limits_changed(self, bounds) -> bool:
+        """
+        Update spectrum_xlim/ylim if the tuned range moved or the power range drifted.
+        
+        The x range is checked every frame (it changes on retune). The y range is
+        only re-fitted every spectrum_autoscale_every frames, and only if either
+        limit moved by more than spectrum_ylim_hysteresis_db or 5% of the current
+        span, whichever is larger (so wide spans don't re-fit on small drifts).
+        
+        Args:
+            bounds: (f_min_hz, f_max_hz, p_min_db, p_max_db) from the scanner
+        
+        Returns:
+            True if the limits changed
+        """
+        changed = False
+        f_min, f_max, p_min, p_max = bounds
+        
+        xlim = (f_min / 1e6, f_max / 1e6)
+        if xlim != self.spectrum_xlim:
+            self.spectrum_xlim = xlim
+            self._spectrum_xlim_hz = (float(f_min), float(f_max))
+            changed = True
+        
+        self.spectrum_frame_count += 1
+        if changed or self.spectrum_frame_count >= self.spectrum_autoscale_every:
+            self.spectrum_frame_count = 0
             margin = (p_max - p_min) * 0.1 if (p_max - p_min) > 0 else 10
-            self.spectrum_ax.set_ylim(p_min - margin, p_max + margin)
-            # Use efficient blitting to redraw only changed regions
-            self.spectrum_canvas.draw_idle()
+            ylim = (p_min - margin, p_max + margin)
+            threshold = max(self.spectrum_ylim_hysteresis_db,
+                            0.05 * (self.spectrum_ylim[1] - self.spectrum_ylim[0]))
+            if (abs(ylim[0] - self.spectrum_ylim[0]) > threshold
+                    or abs(ylim[1] - self.spectrum_ylim[1]) > threshold):
+                self.spectrum_ylim = ylim
+                changed = True
+        
+        return changed
+    
+    def _on_spectrum_resize(self, event) -> None:
+        """Track the spectrum view size and redraw the last spectrum to fit it."""
+        if event.width <= 1 or event.height <= 1:
+            return
+        self._spectrum_size = (event.width, event.height)
+        if self._last_spectrum is not None:
+            self._last_spec_draw = 0.0  # Bypass the frame-rate cap for this redraw
+            self._update_spectrum_plot(*self._last_spectrum)
+            if self.spectrum_renderer is not None:
+                self._wake_poll()  # Pick up the re-rendered frame
+    
+    def _decimate_spectrum(self, frequencies: np.ndarray, power_spectrum: np.ndarray):
+        """
+        Reduce the spectrum to a min/max envelope of two points per canvas pixel.
+        
+        Each pixel column keeps the minimum and maximum power of its block of
+        bins (interleaved), so both narrow peaks and the noise floor look the
+        same as the full-resolution line while the line has far fewer vertices.
+        
+        Args:
+            frequencies: Bin frequencies in Hz
+            power_spectrum: Bin power (dB or quantized dB)
+        
+        Returns:
+            (frequencies, power_spectrum), decimated if the spectrum is more
+            than twice as wide as the canvas
+        """
+        width = self._spectrum_size[0]
+        n = len(power_spectrum)
+        if width <= 1 or n <= width * 2:
+            return frequencies, power_spectrum
+        
+        block = n // width
+        usable = width * block
+        blocks = power_spectrum[:usable].reshape(width, block)
+        envelope = np.empty((width, 2), dtype=power_spectrum.dtype)
+        blocks.min(axis=1, out=envelope[:, 0])
+        blocks.max(axis=1, out=envelope[:, 1])
+        return np.repeat(frequencies[:usable:block], 2), envelope.reshape(-1)
+    
+    def _update_spectrum_plot(self, frequencies: np.ndarray, power_q: np.ndarray, bounds) -> None:
+        """
+        Draw a spectrum from the scanner.
+        
+        Args:
+            frequencies: Bin frequencies in Hz
+            power_q: Bin power as int16 tenths of a dB (see SPECTRUM_DB_SCALE)
+            bounds: (f_min_hz, f_max_hz, p_min_db, p_max_db), precomputed by the
+                scanner so no full-length min/max pass runs here
+        """
+        self._last_spectrum = (frequencies, power_q, bounds)
+        now = time.monotonic()
+        interval = max(self.spectrum_min_interval_s,
+                       self._spec_draw_cost_s / self.spectrum_max_ui_share)
+        if now - self._last_spec_draw < interval:
+            return
+        self._last_spec_draw = now
+        
+        try:
+            # Decimate first, so only about one point per pixel is converted to dB
+            frequencies, power_q = self._decimate_spectrum(frequencies, power_q)
+            n = len(frequencies)
+            if self.spectrum_renderer is None:
+                if self._power_db_buf.shape[0] < n:
+                    self._power_db_buf = np.empty(n, dtype=np.float32)
+                power_spectrum = self._power_db_buf[:n]
+            else:
+                # Handed to the render thread, so this can't be reused next frame
+                power_spectrum = np.empty(n, dtype=np.float32)
+            np.multiply(power_q, 1.0 / SPECTRUM_DB_SCALE, out=power_spectrum)
+            self._spectrum_limits_changed(bounds)
+            
+            if self.spectrum_renderer is None:
+                self._draw_fast_spectrum(frequencies, power_spectrum)
+                self._note_spectrum_cost(time.monotonic() - now)
+            else:
+                # Rendered off-thread; the frame is picked up by a later poll_queue
+                freq_mhz = np.multiply(frequencies, 1e-6, dtype=np.float64)
+                self.spectrum_renderer.submit(
+                    freq_mhz, power_spectrum, self.spectrum_xlim, self.spectrum_ylim,
+                    self._spectrum_size
+                )
+                self._spec_submit_cost_s = time.monotonic() - now
         except Exception: pass
     
+    def _note_spectrum_cost(self, seconds: float) -> None:
+        """Fold one frame's UI-thread drawing time into the moving average."""
+        self._spec_draw_cost_s += 0.2 * (seconds - self._spec_draw_cost_s)
+    
+    @staticmethod
+    def _nice_ticks(lo: float, hi: float, target: int = 5) -> np.ndarray:
+        """
+        Round-numbered tick values (1, 2 or 5 times a power of ten apart) in [lo, hi].
+        
+        Args:
+            lo: Lower limit
+            hi: Upper limit
+            target: Approximate number of ticks wanted
+        
+        Returns:
+            Ascending tick values
+        """
+        span = hi - lo
+        if not span > 0:
+            return np.array([lo])
+        raw = span / target
+        magnitude = 10.0 ** np.floor(np.log10(raw))
+        step = magnitude * next(m for m in (1.0, 2.0, 5.0, 10.0) if m * magnitude >= raw)
+        return np.arange(np.ceil(lo / step) * step, hi + step * 1e-9, step)
+    
+    def _update_spectrum_axes(self, width: int, height: int) -> None:
+        """
+        Recompute the fast view's dB grid rows and place its axis labels.
+        
+        dB ticks get a grid line in the image and a label at the right edge;
+        the minimum, center and maximum frequency are labelled along the bottom.
+        
+        Args:
+            width: View width in pixels
+            height: View height in pixels
+        """
+        y0, y1 = self.spectrum_ylim
+        f_min, f_max = self._spectrum_xlim_hz
+        
+        ticks = self._nice_ticks(y0, y1)
+        rows = np.rint((y1 - ticks) * ((height - 1) / ((y1 - y0) or 1.0))).astype(np.intp)
+        keep = (rows >= 0) & (rows < height - 16)  # Leave the bottom row to the frequency labels
+        ticks, rows = ticks[keep], rows[keep]
+        self._spectrum_grid_rows = rows
+        
+        # Enough decimals to tell the three frequency labels apart
+        span_mhz = max((f_max - f_min) / 1e6, 1e-6)
+        decimals = int(min(6, max(0, np.ceil(-np.log10(span_mhz / 1000)))))
+        
+        placements = [
+            (f"{tick:.0f} dB", dict(relx=1.0, x=-2, y=int(row), anchor="e" if 8 <= row else "ne"))
+            for tick, row in zip(ticks, rows)
+        ]
+        placements += [
+            (f"{f_min / 1e6:.{decimals}f}", dict(relx=0.0, rely=1.0, x=2, anchor="sw")),
+            (f"{(f_min + f_max) / 2e6:.{decimals}f} MHz", dict(relx=0.5, rely=1.0, anchor="s")),
+            (f"{f_max / 1e6:.{decimals}f}", dict(relx=1.0, rely=1.0, x=-2, anchor="se")),
+        ]
+        
+        labels = self._spectrum_axis_labels
+        while len(labels) < len(placements):
+            labels.append(tk.Label(
+                self.spectrum_widget.master, font=self._font10, bg="#ffffff",
+                fg=SPECTRUM_LABEL_FG, borderwidth=0, padx=1, pady=0
+            ))
+        for label, (text, place) in zip(labels, placements):
+            label.configure(text=text)
+            label.place(in_=self.spectrum_widget, **place)
+        for label in labels[len(placements):]:
+            label.place_forget()
+    
+    def _draw_fast_spectrum(self, frequencies: np.ndarray, power_spectrum: np.ndarray) -> None:
+        """
+        Rasterize the spectrum line into an RGB buffer and show it in spectrum_photo.
+        
+        Each pixel column gets a vertical run covering the power values that
+        fall in it (and the step to the next column), so the line is connected
+        and narrow peaks keep their full height. The buffer goes to Tk as
+        binary PPM data, which Tk decodes without PIL.
+        
+        Args:
+            frequencies: Ascending frequencies in Hz (mapped to pixels in float64)
+            power_spectrum: Power in dB
+        """
+        width, height = self._spectrum_size
+        if len(power_spectrum) < 2:
+            return
+        
+        buf = self._spectrum_buf
+        if buf is None or buf.shape[:2] != (height, width):
+            buf = self._spectrum_buf = np.empty((height, width, 3), dtype=np.uint8)
+            self._spectrum_ppm_header = f"P6 {width} {height} 255\n".encode("ascii")
+        buf[:] = SPECTRUM_BG_RGB
+        
+        axes_key = (self._spectrum_xlim_hz, self.spectrum_ylim, width, height)
+        if axes_key != self._spectrum_axes_key:
+            self._spectrum_axes_key = axes_key
+            self._update_spectrum_axes(width, height)
+        buf[self._spectrum_grid_rows] = SPECTRUM_GRID_RGB
+        
+        # Data -> pixel coordinates (row 0 at the top); frequencies stay float64 so
+        # the offset from x0 keeps Hz resolution at GHz carriers
+        x0, x1 = self._spectrum_xlim_hz
+        y0, y1 = self.spectrum_ylim
+        x_px = (np.asarray(frequencies, dtype=np.float64) - x0) * ((width - 1) / ((x1 - x0) or 1.0))
+        y_px = (y1 - power_spectrum) * ((height - 1) / ((y1 - y0) or 1.0))
+        
+        if len(x_px) < width:
+            # Fewer points than columns: interpolate one point per column
+            cols = np.arange(width)
+            y_px = np.interp(cols, x_px, y_px, left=np.nan, right=np.nan)
+            keep = ~np.isnan(y_px)
+            cols, y_px = cols[keep], y_px[keep]
+        else:
+            cols = np.clip(np.rint(x_px), 0, width - 1).astype(np.intp)
+        if len(cols) < 2:
+            return
+        rows = np.clip(np.rint(y_px), 0, height - 1).astype(np.intp)
+        
+        # Vertical run per point, joined to the next point, merged per column
+        nxt = np.append(rows[1:], rows[-1])
+        lo = np.minimum(rows, nxt)
+        hi = np.maximum(rows, nxt)
+        starts = np.flatnonzero(np.append(True, cols[1:] != cols[:-1]))
+        col_ids = cols[starts]
+        lo = np.minimum.reduceat(lo, starts)
+        hi = np.maximum.reduceat(hi, starts)
+        
+        # Columns skipped between points (slightly more points than columns)
+        if col_ids[-1] - col_ids[0] + 1 > len(col_ids):
+            gaps = np.setdiff1d(np.arange(col_ids[0], col_ids[-1] + 1), col_ids)
+            gap_rows = np.rint(np.interp(gaps, cols, rows)).astype(np.intp)
+            col_ids = np.concatenate((col_ids, gaps))
+            lo = np.concatenate((lo, gap_rows))
+            hi = np.concatenate((hi, gap_rows))
+        
+        r = np.arange(height)[:, None]
+        ys, xs = np.nonzero((r >= lo) & (r <= hi))
+        buf[ys, col_ids[xs]] = SPECTRUM_LINE_RGB
+        
+        self._show_spectrum_frame(width, height, self._spectrum_ppm_header + buf.tobytes())
+    
+    def _show_spectrum_frame(self, width: int, height: int, ppm: bytes) -> None:
+        """Load a rendered frame (binary PPM) into the spectrum PhotoImage."""
+        self.spectrum_photo.configure(width=width, height=height, format="PPM", data=ppm)
+    
     def _update_log(self, entry: str) -> None:
+        # Shown at once, after any detection lines still waiting (keeps the order)
+        self._pending_log_lines.append(entry)
+        self._flush_pending_log()
+    
+    def _flush_pending_log(self) -> None:
+        """Write all pending log lines to the textbox in one batch."""
+        lines = self._pending_log_lines
+        self._pending_log_lines = []
+        self._log_flushed_at = time.monotonic()
+        self._flush_log_batch(lines)
+    
+    def _flush_log_batch(self, lines: List[str]) -> None:
+        """
+        Append lines to the log with one insert, trimming the oldest past max_log_entries.
+        
+        The _log_lines deque mirrors the widget, so nothing is read back from Tk.
+        A batch that pushes out every shown line (a detection burst) replaces the
+        text with the deque's last max_log_entries lines instead of inserting
+        lines only to delete them again.
+        """
+        if not lines:
+            return
+        shown = len(self._log_lines)
+        overflow = shown + len(lines) - self.max_log_entries
+        self._log_lines.extend(lines)
         self.log_textbox.configure(state="normal")
-        self.log_textbox.insert("end", entry + "\n")
-        # Optimization: Don't read full text, just check line count
-        if int(self.log_textbox.index('end-1c').split('.')[0]) > self.max_log_entries:
-            self.log_textbox.delete("1.0", "2.0")
+        if overflow >= shown:
+            self.log_textbox.delete("1.0", "end")
+            self.log_textbox.insert("end", "\n".join(self._log_lines) + "\n")
+        else:
+            self.log_textbox.insert("end", "\n".join(lines) + "\n")
+            if overflow > 0:
+                self.log_textbox.delete("1.0", f"{overflow + 1}.0")
         self.log_textbox.see("end")
         self.log_textbox.configure(state="disabled")
     
     def _update_status(self, status: str, color: str) -> None:
+        if (status, color) == self._last_status:
+            return
+        self._last_status = (status, color)
         self.status_label.configure(text=f"Status: {status}", text_color=color)
     
     def _update_counter(self) -> None:
+        if self.detection_count == self._shown_count:
+            return
+        self._shown_count = self.detection_count
+        self._counter_shown_at = time.monotonic()
         self.counter_label.configure(text=f"Detections: {self.detection_count}")
     
     def _on_closing(self) -> None:
@@ -614,6 +1181,8 @@ class MainWindow(ctk.CTk):
         # Save current state before closing
         self._save_frequency_and_volume()
         self.scanner.shutdown()
+        if self.spectrum_renderer is not None:
+            self.spectrum_renderer.stop()
         self.destroy()
 
 def main() -> None:
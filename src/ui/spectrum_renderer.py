@@ -0,0 +1,179 @@
+"""
+Spectrum Renderer Module
+
+This module renders the Matplotlib spectrum plot off-screen (Agg) on a worker
+thread. The Tk thread only submits data and shows the finished image, so Agg
+rasterization no longer blocks UI event handling.
+"""
+
+import threading
+from typing import Optional, Tuple
+import numpy as np
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Rendered frame: (width, height, binary PPM data for tk.PhotoImage)
+Frame = Tuple[int, int, bytes]
+
+
+class SpectrumRenderer(threading.Thread):
+    """
+    Worker thread owning an off-screen Matplotlib figure of the spectrum.
+    
+    submit() and take_frame() are the only methods the UI thread calls. Both
+    hand over data through single attributes (latest value wins), which are
+    atomic under the GIL; the figure itself is only touched by this thread.
+    """
+    
+    def __init__(self, width: int = 800, height: int = 300, dpi: int = 100) -> None:
+        """
+        Initialize the renderer and its off-screen figure.
+        
+        Args:
+            width: Initial image width in pixels (default: 800)
+            height: Initial image height in pixels (default: 300)
+            dpi: Figure resolution (default: 100)
+        """
+        super().__init__(daemon=True, name="spectrum-render")
+        self._dpi: int = dpi
+        self._size: Tuple[int, int] = (width, height)
+        
+        self.fig: Figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        self.canvas: FigureCanvasAgg = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_xlabel('Frequency (MHz)', fontsize=9)
+        self.ax.set_ylabel('Power (dB)', fontsize=9)
+        self.ax.set_title('Real-Time Spectrum', fontsize=10, weight='bold')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.tick_params(labelsize=8)
+        # Animated: full draws skip the line, so the cached background is the bare axes
+        self.line, = self.ax.plot([], [], 'b-', linewidth=1, animated=True)
+        self._xlim: Tuple[float, float] = (0.0, 1000.0)
+        self._ylim: Tuple[float, float] = (-80.0, 0.0)
+        self.ax.set_xlim(*self._xlim)
+        self.ax.set_ylim(*self._ylim)
+        self.fig.tight_layout()
+        self._bg = None  # Axes background, re-cached after every full draw
+        
+        # Latest request from the UI, and a wake-up for the render loop
+        self._request: Optional[Tuple[np.ndarray, np.ndarray, Tuple[float, float], Tuple[float, float], Tuple[int, int]]] = None
+        self._wake: threading.Event = threading.Event()
+        self._running: bool = True
+        self._rendering: bool = False
+        
+        # Latest rendered frame, emptied by take_frame()
+        self.frame_slot: Optional[Frame] = None
+    
+    def submit(
+        self,
+        freq_mhz: np.ndarray,
+        power_db: np.ndarray,
+        xlim: Tuple[float, float],
+        ylim: Tuple[float, float],
+        size: Tuple[int, int]
+    ) -> None:
+        """
+        Queue a spectrum for rendering, replacing any not yet rendered.
+        
+        Args:
+            freq_mhz: Frequencies in MHz
+            power_db: Power in dB
+            xlim: X axis limits in MHz
+            ylim: Y axis limits in dB
+            size: Target image size (width, height) in pixels
+        """
+        self._request = (freq_mhz, power_db, xlim, ylim, size)
+        self._wake.set()
+    
+    @property
+    def pending(self) -> bool:
+        """True while a submitted spectrum has not yet been taken as a frame."""
+        return self._request is not None or self._rendering or self.frame_slot is not None
+    
+    def take_frame(self) -> Optional[Frame]:
+        """
+        Take the latest rendered frame, leaving the slot empty.
+        
+        Returns:
+            (width, height, PPM data), or None if nothing new was rendered
+        """
+        frame = self.frame_slot
+        if frame is not None:
+            self.frame_slot = None
+        return frame
+    
+    def stop(self) -> None:
+        """
+        Stop the render thread.
+        """
+        self._running = False
+        self._wake.set()
+        if self.is_alive():
+            self.join(timeout=1.0)
+    
+    def run(self) -> None:
+        """
+        Render loop: sleep until a spectrum is submitted, then render the latest one.
+        """
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if not self._running:
+                return
+            
+            # Flagged before taking the request, so pending never reads False in between
+            self._rendering = True
+            request = self._request
+            self._request = None
+            try:
+                if request is not None:
+                    self.frame_slot = self._render(*request)
+            except Exception as e:
+                print(f"Error rendering spectrum: {e}")
+            finally:
+                self._rendering = False
+    
+    def _render(
+        self,
+        freq_mhz: np.ndarray,
+        power_db: np.ndarray,
+        xlim: Tuple[float, float],
+        ylim: Tuple[float, float],
+        size: Tuple[int, int]
+    ) -> Frame:
+        """
+        Render one frame, blitting only the line unless the layout changed.
+        
+        Returns:
+            (width, height, PPM data)
+        """
+        full_draw = self._bg is None
+        
+        if size != self._size and size[0] > 1 and size[1] > 1:
+            self._size = size
+            self.fig.set_size_inches(size[0] / self._dpi, size[1] / self._dpi)
+            self.fig.tight_layout()
+            full_draw = True
+        if xlim != self._xlim:
+            self._xlim = xlim
+            self.ax.set_xlim(*xlim)
+            full_draw = True
+        if ylim != self._ylim:
+            self._ylim = ylim
+            self.ax.set_ylim(*ylim)
+            full_draw = True
+        
+        self.line.set_data(freq_mhz, power_db)
+        if full_draw:
+            self.canvas.draw()
+            self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        else:
+            self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.line)
+        
+        # RGBA -> RGB, as binary PPM
+        rgba = np.asarray(self.canvas.buffer_rgba())
+        height, width = rgba.shape[:2]
+        header = f"P6 {width} {height} 255\n".encode("ascii")
+        return width, height, header + np.ascontiguousarray(rgba[:, :, :3]).tobytes()
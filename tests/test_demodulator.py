@@ -0,0 +1,53 @@
+"""
+Checks for FMDemodulator.demodulate_batch against per-chunk demodulate().
+
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+import numpy as np
+
+from src.core.demodulator import FMDemodulator, NUMBA_AVAILABLE
+
+SAMPLE_RATE = 960000  # 20x decimation to 48 kHz, as in manual mode
+CHUNK_LEN = 19200
+
+
+class DemodulateBatchTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.chunks = (0.1 * (rng.standard_normal((4, CHUNK_LEN))
+                              + 1j * rng.standard_normal((4, CHUNK_LEN)))).astype(np.complex64)
+        self.chunks[2] *= 1e-4  # Below the squelch threshold
+        # The Numba discriminator uses a polynomial atan2 (~0.0015 rad error)
+        self.atol = 1e-3 if NUMBA_AVAILABLE else 1e-5
+
+    def test_rows_match_per_chunk_demodulate(self) -> None:
+        for mode in ("NFM", "WFM", "AM"):
+            batch = FMDemodulator(sample_rate=SAMPLE_RATE).demodulate_batch(
+                self.chunks, SAMPLE_RATE, -40.0, mode
+            )
+            self.assertEqual(batch.shape, (4, CHUNK_LEN // 20))
+            for i, chunk in enumerate(self.chunks):
+                # Fresh demodulator per chunk: rows are independent windows
+                expected = FMDemodulator(sample_rate=SAMPLE_RATE).demodulate(
+                    chunk, SAMPLE_RATE, -40.0, mode
+                )
+                np.testing.assert_allclose(batch[i], expected, atol=self.atol, err_msg=f"{mode} row {i}")
+
+    def test_squelched_row_is_silent(self) -> None:
+        batch = FMDemodulator(sample_rate=SAMPLE_RATE).demodulate_batch(
+            self.chunks, SAMPLE_RATE, -40.0, "NFM"
+        )
+        self.assertFalse(batch[2].any())
+
+    def test_rejects_length_not_multiple_of_decimation(self) -> None:
+        with self.assertRaises(ValueError):
+            FMDemodulator(sample_rate=SAMPLE_RATE).demodulate_batch(
+                self.chunks[:, :CHUNK_LEN - 10], SAMPLE_RATE
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
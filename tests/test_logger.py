@@ -0,0 +1,136 @@
+"""
+Checks for SignalLogger event validation and batch writes.
+
+Run with: python -m unittest discover tests
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from src.data.logger import SignalLogger, PYARROW_AVAILABLE
+
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
+
+
+def scanner_event(**overrides):
+    event = {
+        "timestamp": "2024-01-01T00:00:00",
+        "timestamp_ns": 1704067200000000000,
+        "frequency_hz": 146520000.0,
+        "relative_power_db": 12.5,
+        "band_name": "2m",
+    }
+    event.update(overrides)
+    return event
+
+
+class EventRowTest(unittest.TestCase):
+
+    def test_scanner_event_takes_fast_path(self) -> None:
+        self.assertEqual(
+            SignalLogger._event_row(scanner_event()),
+            (1704067200000000000, 146520000.0, 12.5, "2m")
+        )
+
+    def test_other_numeric_types_are_coerced(self) -> None:
+        row = SignalLogger._event_row(scanner_event(
+            frequency_hz=np.float64(1e8), relative_power_db=np.float32(3.0), timestamp_ns=np.int64(5)
+        ))
+        self.assertEqual(row, (5, 1e8, 3.0, "2m"))
+        self.assertIs(type(row[0]), int)
+        self.assertIs(type(row[2]), float)
+
+    def test_bad_values_are_rejected(self) -> None:
+        for bad in (
+            {"timestamp_ns": None, "timestamp": ""},
+            {"frequency_hz": None},
+            {"frequency_hz": "abc"},
+            {"relative_power_db": float("nan")},
+            {"frequency_hz": float("inf")},
+        ):
+            self.assertIsNone(SignalLogger._event_row(scanner_event(**bad)), bad)
+
+    def test_missing_band_name_defaults(self) -> None:
+        self.assertEqual(SignalLogger._event_row(scanner_event(band_name=None))[3], "Unknown")
+
+
+class BatchWriteTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.logger = SignalLogger(os.path.join(self.tmpdir.name, "scan.db"))
+
+    def tearDown(self) -> None:
+        self.logger.close()
+        self.tmpdir.cleanup()
+
+    def test_bad_event_does_not_drop_batch(self) -> None:
+        written = self.logger.log_events([
+            scanner_event(),
+            scanner_event(relative_power_db=None),  # Falls back to power_db default
+            scanner_event(frequency_hz=None),
+            scanner_event(frequency_hz=1.5e8),
+        ])
+        self.assertEqual(written, 3)
+        self.assertEqual(self.logger.get_detection_count(), 3)
+
+
+class ShadowWriteTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.logger = SignalLogger(os.path.join(self.tmpdir.name, "scan.db"), shadow_flush_interval_s=60.0)
+
+    def tearDown(self) -> None:
+        self.logger.close()
+        self.tmpdir.cleanup()
+
+    def test_shadow_batches_and_bulk_writes_intern_bands_together(self) -> None:
+        def bulk() -> None:
+            for i in range(20):
+                self.logger.log_events(scanner_event(band_name=f"bulk{i}") for _ in range(10))
+
+        writer = threading.Thread(target=bulk)
+        writer.start()
+        for i in range(200):
+            self.assertTrue(self.logger.log_event(scanner_event(band_name=f"live{i % 20}")))
+        writer.join()
+        self.assertTrue(self.logger.flush(timeout=10.0))
+        self.assertEqual(self.logger.get_detection_count(), 400)
+        names = {row[4] for row in self.logger.get_recent_detections(limit=400)}
+        self.assertEqual(len(names), 40)
+
+
+@unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+class ArrowSinkTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.arrow_path = os.path.join(self.tmpdir.name, "scan.arrows")
+        self.logger = SignalLogger(os.path.join(self.tmpdir.name, "scan.db"), arrow_path=self.arrow_path)
+
+    def tearDown(self) -> None:
+        self.logger.close()
+        self.tmpdir.cleanup()
+
+    def test_clear_restarts_arrow_stream(self) -> None:
+        self.logger.log_event(scanner_event())
+        self.assertTrue(self.logger.flush(timeout=10.0))
+        self.logger.log_event(scanner_event(frequency_hz=1.5e8))  # Discarded by the clear
+        self.assertTrue(self.logger.clear_all_detections())
+        self.logger.log_event(scanner_event(frequency_hz=4.4e8))
+        self.logger.close()
+
+        with pa.OSFile(self.arrow_path, "rb") as source:
+            table = pa.ipc.open_stream(source).read_all()
+        self.assertEqual(table.column("frequency_hz").to_pylist(), [4.4e8])
+        self.assertEqual(self.logger.get_detection_count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()